@@ -3,13 +3,20 @@
 import asyncio
 import logging
 import os
-from typing import Optional
+import sys
+from typing import Any, Coroutine, Optional
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional and unavailable on Windows
+    uvloop = None
+
 from . import server
 from .hubspot_client import HubSpotClient
 
-# Set up logging
+# Set up logging (level configurable via MCP_LOG_LEVEL, e.g. DEBUG)
 logging.basicConfig(
-    level=logging.INFO,
+    level=os.getenv("MCP_LOG_LEVEL", "INFO").upper(),
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
 )
 
@@ -23,6 +30,18 @@ async def main(access_token: Optional[str] = None):
     # Call the server main function
     await server.main(access_token)
 
+def _run(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Run a coroutine on uvloop when it is installed, else on the default loop."""
+    if uvloop is None:
+        return asyncio.run(coro)
+
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            return runner.run(coro)
+
+    uvloop.install()
+    return asyncio.run(coro)
+
 def run_main():
     """Synchronous entry point for the package."""
     import argparse
@@ -36,8 +55,8 @@ def run_main():
     
     args = parser.parse_args()
     
-    # Run the main function through asyncio
-    asyncio.run(main(access_token=args.access_token))
+    # Run the main function through asyncio (on uvloop when available)
+    _run(main(access_token=args.access_token))
 
 if __name__ == "__main__":
     run_main()
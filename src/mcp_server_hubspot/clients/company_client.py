@@ -1,31 +1,137 @@
 """
 Client for HubSpot company-related operations.
 """
-import json
 import logging
-from typing import Any, Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
+import requests
 from hubspot import HubSpot
 from hubspot.crm.companies import PublicObjectSearchRequest
 from hubspot.crm.contacts.exceptions import ApiException
 
-from ..core.formatters import convert_datetime_fields
+from ..core.formatters import parse_timestamp_ms, project_crm_object
+from ..core.serialization import dumps, loads
 from ..core.error_handler import handle_hubspot_errors
+from ..core.cache import TTLCache, ttl_cached
+from ..core.http import create_session, send_api_request
+from ..core.rate_limiter import get_rate_limiter
 
 logger = logging.getLogger('mcp_hubspot_client.company')
 
+# Largest page requested from the CRM search API
+SEARCH_PAGE_SIZE = 100
+
+# Sort order and properties of recent-activity searches (constant across calls)
+RECENT_SEARCH_SORTS = ({"propertyName": "lastmodifieddate", "direction": "DESCENDING"},)
+RECENT_SEARCH_PROPERTIES = ("name", "domain", "website", "phone", "industry", "hs_lastmodifieddate")
+
+# Seconds to reuse get_recent and get_activity results for identical calls
+RECENT_CACHE_TTL = 30
+ACTIVITY_CACHE_TTL = 10
+
+# Largest page the associations v4 API returns
+ASSOCIATIONS_PAGE_SIZE = 500
+
+# Maximum number of engagement requests in flight at once
+ENGAGEMENT_FETCH_WORKERS = 10
+
+# HubSpot CRM v3 batch read accepts at most 100 inputs per call
+ENGAGEMENT_BATCH_SIZE = 100
+
+# CRM v3 engagement properties mapped onto the legacy v1 metadata keys, per engagement type
+ENGAGEMENT_V3_METADATA_PROPERTIES = {
+    "NOTE": {"body": "hs_note_body"},
+    "EMAIL": {"subject": "hs_email_subject", "text": "hs_email_text", "html": "hs_email_html"},
+    "TASK": {"subject": "hs_task_subject", "body": "hs_task_body", "status": "hs_task_status"},
+    "MEETING": {
+        "title": "hs_meeting_title",
+        "body": "hs_meeting_body",
+        "startTime": "hs_meeting_start_time",
+        "endTime": "hs_meeting_end_time",
+        "internalMeetingNotes": "hs_internal_meeting_notes"
+    },
+    "CALL": {
+        "body": "hs_call_body",
+        "fromNumber": "hs_call_from_number",
+        "toNumber": "hs_call_to_number",
+        "durationMilliseconds": "hs_call_duration",
+        "status": "hs_call_status",
+        "disposition": "hs_call_disposition"
+    }
+}
+
+# Formatted engagement fields and the v1 engagement keys they are read from
+ENGAGEMENT_FIELDS = (
+    ("id", "id"),
+    ("type", "type"),
+    ("created_at", "createdAt"),
+    ("last_updated", "lastUpdated"),
+    ("created_by", "createdBy"),
+    ("modified_by", "modifiedBy"),
+    ("timestamp", "timestamp")
+)
+
+# Participant fields kept for email engagements, and the recipient lists they appear in
+EMAIL_PARTICIPANT_FIELDS = ("raw", "email", "firstName", "lastName")
+EMAIL_RECIPIENT_FIELDS = ("to", "cc", "bcc")
+
+# v3 engagement properties that v1 returns as epoch milliseconds or integers
+ENGAGEMENT_V3_TIMESTAMP_PROPERTIES = frozenset({"hs_timestamp", "hs_meeting_start_time", "hs_meeting_end_time"})
+ENGAGEMENT_V3_INTEGER_PROPERTIES = frozenset({"hs_created_by", "hs_modified_by", "hs_call_duration"})
+
+# Keys of the hs_email_headers property copied into v1 email metadata
+EMAIL_HEADER_FIELDS = ("from", "sender", "to", "cc", "bcc")
+
+# Objects whose associations are read for batch-fetched engagements, and the v1 keys they fill
+ENGAGEMENT_ASSOCIATION_TYPES = {
+    "contacts": "contactIds",
+    "companies": "companyIds",
+    "deals": "dealIds",
+    "tickets": "ticketIds"
+}
+
+ENGAGEMENT_BATCH_PROPERTIES = [
+    "hs_engagement_type", "hs_timestamp", "hs_created_by", "hs_modified_by",
+    "hubspot_owner_id", "hs_email_headers"
+] + [
+    prop for type_properties in ENGAGEMENT_V3_METADATA_PROPERTIES.values()
+    for prop in type_properties.values()
+]
+
 class CompanyClient:
     """Client for HubSpot company-related operations."""
     
-    def __init__(self, hubspot_client: HubSpot, access_token: str):
+    def __init__(
+        self, 
+        hubspot_client: HubSpot, 
+        access_token: str, 
+        session: Optional[requests.Session] = None
+    ):
         """Initialize with HubSpot client instance.
         
         Args:
             hubspot_client: Initialized HubSpot client
             access_token: HubSpot API access token
+            session: Pooled HTTP session for raw API requests (default: a new session)
         """
         self.client = hubspot_client
         self.access_token = access_token
+        self.session = session or create_session()
+        self.rate_limiter = get_rate_limiter(access_token)
+        self._recent_cache = TTLCache(ttl=RECENT_CACHE_TTL)
+        self._activity_cache = TTLCache(ttl=ACTIVITY_CACHE_TTL)
+        self._content_formatters = {
+            "NOTE": self._format_note_content,
+            "EMAIL": self._format_email_content,
+            "TASK": self._format_task_content,
+            "MEETING": self._format_meeting_content,
+            "CALL": self._format_call_content
+        }
+    
+    def invalidate_recent(self) -> None:
+        """Discard cached get_recent results, e.g. after a company is created."""
+        self._recent_cache.clear()
     
     @handle_hubspot_errors
     def get_recent(self, limit: int = 10) -> str:
@@ -37,31 +143,74 @@ class CompanyClient:
         Returns:
             JSON string with company data
         """
-        search_request = self._create_company_search_request(limit)
-        search_response = self.client.crm.companies.search_api.do_search(
-            public_object_search_request=search_request
-        )
+        return dumps(self.get_recent_data(limit))
+    
+    @ttl_cached("_recent_cache")
+    def get_recent_data(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Get most recently active companies from HubSpot as parsed data.
         
-        companies_dict = [company.to_dict() for company in search_response.results]
-        converted_companies = convert_datetime_fields(companies_dict)
-        return json.dumps(converted_companies)
+        Args:
+            limit: Maximum number of companies to return (default: 10)
+            
+        Returns:
+            List of company dictionaries
+            
+        Raises:
+            ApiException: If the HubSpot API request fails
+        """
+        return [
+            project_crm_object(company, RECENT_SEARCH_PROPERTIES)
+            for company in self._search_recent_companies(limit)
+        ]
     
-    def _create_company_search_request(self, limit: int) -> PublicObjectSearchRequest:
+    def _search_recent_companies(self, limit: int) -> List[Any]:
+        """Search for recently modified companies, one page of at most SEARCH_PAGE_SIZE at a time.
+        
+        Args:
+            limit: Maximum number of companies to return
+            
+        Returns:
+            List of company objects from the search API
+        """
+        companies = []
+        after = None
+        
+        while len(companies) < limit:
+            search_request = self._create_company_search_request(
+                min(SEARCH_PAGE_SIZE, limit - len(companies)), after
+            )
+            with self.rate_limiter:
+                search_response = self.client.crm.companies.search_api.do_search(
+                    public_object_search_request=search_request
+                )
+            companies.extend(search_response.results)
+            
+            paging = getattr(search_response, "paging", None)
+            after = paging.next.after if paging and paging.next else None
+            if not after or not search_response.results:
+                break
+        
+        return companies
+    
+    def _create_company_search_request(
+        self, 
+        limit: int, 
+        after: Optional[str] = None
+    ) -> PublicObjectSearchRequest:
         """Create a search request for companies sorted by last modified date.
         
         Args:
             limit: Maximum number of results to return
+            after: Pagination cursor from a previous search page (default: None)
             
         Returns:
             Configured search request object
         """
         return PublicObjectSearchRequest(
-            sorts=[{
-                "propertyName": "lastmodifieddate",
-                "direction": "DESCENDING"
-            }],
+            sorts=RECENT_SEARCH_SORTS,
             limit=limit,
-            properties=["name", "domain", "website", "phone", "industry", "hs_lastmodifieddate"]
+            after=after,
+            properties=RECENT_SEARCH_PROPERTIES
         )
         
     @handle_hubspot_errors
@@ -74,67 +223,291 @@ class CompanyClient:
         Returns:
             JSON string with company activity data
         """
-        associated_engagements = self._get_company_engagements(company_id)
-        engagement_ids = self._extract_engagement_ids(associated_engagements)
-        activities = self._get_engagement_details(engagement_ids)
+        return dumps(self.get_activity_data(company_id))
+    
+    @ttl_cached("_activity_cache")
+    def get_activity_data(self, company_id: str) -> List[Dict[str, Any]]:
+        """Get activity history for a specific company as parsed data.
+        
+        Args:
+            company_id: HubSpot company ID
+            
+        Returns:
+            List of engagement dictionaries
+            
+        Raises:
+            ApiException: If the HubSpot API request fails
+        """
+        engagement_pages = self._get_company_engagements(company_id)
+        engagement_ids = self._extract_engagement_ids(engagement_pages)
+        return self._get_engagement_details(engagement_ids)
         
-        converted_activities = convert_datetime_fields(activities)
-        return json.dumps(converted_activities)
+    def _get_company_engagements(self, company_id: str) -> Iterator[Any]:
+        """Get all engagement associations of the company, page by page.
         
-    def _get_company_engagements(self, company_id: str) -> Any:
-        """Get all engagement IDs associated with the company.
+        Follows the paging cursor until the last page, so companies with more
+        than ASSOCIATIONS_PAGE_SIZE engagements are not truncated.
         
         Args:
             company_id: HubSpot company ID
             
-        Returns:
-            Association response object
+        Yields:
+            Association response objects, one per page
         """
-        return self.client.crm.associations.v4.basic_api.get_page(
-            object_type="companies",
-            object_id=company_id,
-            to_object_type="engagements",
-            limit=500
-        )
+        after = None
+        while True:
+            with self.rate_limiter:
+                page = self.client.crm.associations.v4.basic_api.get_page(
+                    object_type="companies",
+                    object_id=company_id,
+                    to_object_type="engagements",
+                    limit=ASSOCIATIONS_PAGE_SIZE,
+                    after=after
+                )
+            yield page
+            
+            paging = getattr(page, "paging", None)
+            after = paging.next.after if paging and paging.next else None
+            if not after:
+                return
         
-    def _extract_engagement_ids(self, associated_engagements: Any) -> List[str]:
-        """Extract engagement IDs from the associations response.
+    def _extract_engagement_ids(self, engagement_pages: Iterable[Any]) -> List[str]:
+        """Extract engagement IDs from pages of the associations response.
         
         Args:
-            associated_engagements: Response from associations API
+            engagement_pages: Response pages from associations API
             
         Returns:
-            List of engagement IDs
+            List of unique engagement IDs, in the order they were returned
         """
-        engagement_ids = []
-        if hasattr(associated_engagements, 'results'):
-            for result in associated_engagements.results:
-                engagement_ids.append(result.to_object_id)
-        return engagement_ids
+        return list(dict.fromkeys(
+            result.to_object_id
+            for page in engagement_pages
+            for result in getattr(page, 'results', None) or ()
+        ))
         
     def _get_engagement_details(self, engagement_ids: List[str]) -> List[Dict[str, Any]]:
         """Get detailed information for each engagement.
         
+        Engagements are read through the CRM v3 batch endpoint in chunks of
+        ENGAGEMENT_BATCH_SIZE, with the chunks sent concurrently. Any engagement
+        missing from the batch responses is fetched individually from the
+        legacy v1 endpoint.
+        
         Args:
             engagement_ids: List of engagement IDs to retrieve
             
         Returns:
             List of formatted engagement details
         """
-        activities = []
-        for engagement_id in engagement_ids:
+        if not engagement_ids:
+            return []
+        
+        batches = [
+            engagement_ids[i:i + ENGAGEMENT_BATCH_SIZE]
+            for i in range(0, len(engagement_ids), ENGAGEMENT_BATCH_SIZE)
+        ]
+        
+        with ThreadPoolExecutor(max_workers=ENGAGEMENT_FETCH_WORKERS) as executor:
+            engagements_by_id: Dict[str, Dict[str, Any]] = {}
+            for batch_engagements in executor.map(self._batch_read_engagements, batches):
+                engagements_by_id.update(batch_engagements)
+            
+            missing_ids = [
+                engagement_id for engagement_id in engagement_ids
+                if str(engagement_id) not in engagements_by_id
+            ]
+            if missing_ids:
+                logger.debug(f"Fetching {len(missing_ids)} engagements individually")
+                for engagement_id, engagement in zip(
+                    missing_ids, executor.map(self._fetch_engagement, missing_ids)
+                ):
+                    if engagement is not None:
+                        engagements_by_id[str(engagement_id)] = engagement
+        
+        return [
+            engagements_by_id[str(engagement_id)] for engagement_id in engagement_ids
+            if str(engagement_id) in engagements_by_id
+        ]
+    
+    def _batch_read_engagements(self, engagement_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Read a batch of engagements through the CRM v3 batch endpoint.
+        
+        Args:
+            engagement_ids: Engagement IDs to retrieve (at most ENGAGEMENT_BATCH_SIZE)
+            
+        Returns:
+            Formatted engagements keyed by engagement ID. Engagements that could
+            not be read or converted are omitted. If the engagements or their
+            associations cannot be read, the whole batch is omitted so that it
+            is fetched from the v1 endpoint instead.
+        """
+        try:
+            response = self._api_request({
+                "method": "POST",
+                "path": "/crm/v3/objects/engagements/batch/read",
+                "body": {
+                    "inputs": [{"id": str(engagement_id)} for engagement_id in engagement_ids],
+                    "properties": ENGAGEMENT_BATCH_PROPERTIES
+                }
+            })
+            response.raise_for_status()
+            results = response.json().get("results", [])
+            associations = self._batch_read_engagement_associations(engagement_ids)
+        except Exception as e:
+            logger.warning(f"Batch engagement read failed, falling back to single requests: {str(e)}")
+            return {}
+        
+        engagements = {}
+        for result in results:
             try:
-                engagement_response = self.client.api_request({
-                    "method": "GET",
-                    "path": f"/engagements/v1/engagements/{engagement_id}"
-                }).json()
-                
-                formatted_engagement = self._format_engagement(engagement_response)
-                activities.append(formatted_engagement)
-            except Exception as e:
-                logger.error(f"Error retrieving engagement {engagement_id}: {str(e)}")
-        
-        return activities
+                engagement_response = self._convert_batch_engagement(
+                    result, associations.get(str(result.get("id")), {})
+                )
+            except (KeyError, TypeError, ValueError) as e:
+                logger.warning(f"Could not convert engagement {result.get('id')}: {str(e)}")
+                continue
+            if engagement_response:
+                engagements[str(result.get("id"))] = self._format_engagement(engagement_response)
+        return engagements
+    
+    def _batch_read_engagement_associations(self, engagement_ids: List[str]) -> Dict[str, Dict[str, List[int]]]:
+        """Read the CRM associations of a batch of engagements.
+        
+        Args:
+            engagement_ids: Engagement IDs (at most ENGAGEMENT_BATCH_SIZE)
+            
+        Returns:
+            v1-style association ID lists (contactIds, companyIds, ...) keyed by
+            engagement ID
+            
+        Raises:
+            requests.HTTPError: If an associations request fails
+        """
+        associations = {
+            str(engagement_id): {key: [] for key in ENGAGEMENT_ASSOCIATION_TYPES.values()}
+            for engagement_id in engagement_ids
+        }
+        inputs = [{"id": str(engagement_id)} for engagement_id in engagement_ids]
+        
+        for object_type, key in ENGAGEMENT_ASSOCIATION_TYPES.items():
+            response = self._api_request({
+                "method": "POST",
+                "path": f"/crm/v4/associations/engagements/{object_type}/batch/read",
+                "body": {"inputs": inputs}
+            })
+            response.raise_for_status()
+            for result in response.json().get("results", []):
+                engagement_associations = associations.get(str(result.get("from", {}).get("id")))
+                if engagement_associations is not None:
+                    engagement_associations[key] = [int(to["toObjectId"]) for to in result.get("to", ())]
+        
+        return associations
+    
+    def _convert_batch_engagement(
+        self, 
+        result: Dict[str, Any], 
+        associations: Dict[str, List[int]]
+    ) -> Optional[Dict[str, Any]]:
+        """Convert a CRM v3 engagement into the legacy v1 response structure.
+        
+        Timestamps are converted to epoch milliseconds and numeric properties
+        to integers, as the v1 endpoint returns them.
+        
+        Args:
+            result: Single engagement from a v3 batch read response
+            associations: v1-style association ID lists of the engagement
+            
+        Returns:
+            Engagement in v1 structure, or None if the engagement type is unknown
+        """
+        properties = {
+            prop: self._convert_v3_property(prop, value)
+            for prop, value in (result.get("properties") or {}).items()
+        }
+        engagement_type = properties.get("hs_engagement_type")
+        if not engagement_type:
+            return None
+        
+        metadata = {
+            key: properties[prop]
+            for key, prop in ENGAGEMENT_V3_METADATA_PROPERTIES.get(engagement_type, {}).items()
+            if properties.get(prop) is not None
+        }
+        if engagement_type == "EMAIL" and properties.get("hs_email_headers"):
+            headers = loads(properties["hs_email_headers"])
+            metadata.update({key: headers[key] for key in EMAIL_HEADER_FIELDS if key in headers})
+        
+        created_at = result.get("createdAt")
+        updated_at = result.get("updatedAt")
+        owner_id = properties.get("hubspot_owner_id")
+        return {
+            "engagement": {
+                "id": int(result["id"]),
+                "type": engagement_type,
+                "createdAt": parse_timestamp_ms(created_at) if created_at else None,
+                "lastUpdated": parse_timestamp_ms(updated_at) if updated_at else None,
+                "createdBy": properties.get("hs_created_by"),
+                "modifiedBy": properties.get("hs_modified_by"),
+                "timestamp": properties.get("hs_timestamp")
+            },
+            "metadata": metadata,
+            "associations": {
+                **associations,
+                "ownerIds": [int(owner_id)] if owner_id else []
+            }
+        }
+    
+    def _convert_v3_property(self, prop: str, value: Optional[str]) -> Any:
+        """Convert a v3 property string to the type the v1 endpoint returns.
+        
+        Args:
+            prop: v3 property name
+            value: Property value as returned by the v3 API
+            
+        Returns:
+            Epoch milliseconds for timestamps, int for numeric properties,
+            otherwise the value unchanged
+        """
+        if not value:
+            return value
+        if prop in ENGAGEMENT_V3_TIMESTAMP_PROPERTIES:
+            return parse_timestamp_ms(value)
+        if prop in ENGAGEMENT_V3_INTEGER_PROPERTIES:
+            return int(value)
+        return value
+    
+    def _fetch_engagement(self, engagement_id: str) -> Optional[Dict[str, Any]]:
+        """Fetch and format a single engagement.
+        
+        Args:
+            engagement_id: Engagement ID to retrieve
+            
+        Returns:
+            Formatted engagement details, or None if the request failed
+        """
+        try:
+            engagement_response = self._api_request({
+                "method": "GET",
+                "path": f"/engagements/v1/engagements/{engagement_id}"
+            }).json()
+            
+            return self._format_engagement(engagement_response)
+        except Exception as e:
+            logger.error(f"Error retrieving engagement {engagement_id}: {str(e)}")
+            return None
+        
+    def _api_request(self, options: Dict[str, Any]) -> Any:
+        """Send a raw HubSpot API request over the client's pooled session.
+        
+        Args:
+            options: Request options as accepted by HubSpot.api_request
+            
+        Returns:
+            HTTP response
+        """
+        with self.rate_limiter:
+            return send_api_request(self.session, self.client, options)
         
     def _format_engagement(self, engagement_response: Dict[str, Any]) -> Dict[str, Any]:
         """Format the engagement response into a standardized structure.
@@ -148,19 +521,11 @@ class CompanyClient:
         engagement_data = engagement_response.get('engagement', {})
         metadata = engagement_response.get('metadata', {})
         
-        formatted_engagement = {
-            "id": engagement_data.get("id"),
-            "type": engagement_data.get("type"),
-            "created_at": engagement_data.get("createdAt"),
-            "last_updated": engagement_data.get("lastUpdated"),
-            "created_by": engagement_data.get("createdBy"),
-            "modified_by": engagement_data.get("modifiedBy"),
-            "timestamp": engagement_data.get("timestamp"),
-            "associations": engagement_response.get("associations", {})
-        }
+        formatted_engagement = {dst: engagement_data.get(src) for dst, src in ENGAGEMENT_FIELDS}
+        formatted_engagement["associations"] = engagement_response.get("associations", {})
         
         # Add type-specific content formatting
-        engagement_type = engagement_data.get("type")
+        engagement_type = formatted_engagement["type"]
         if engagement_type:
             formatted_engagement["content"] = self._format_engagement_content(
                 engagement_type, metadata
@@ -179,17 +544,21 @@ class CompanyClient:
         Returns:
             Formatted content specific to the engagement type
         """
-        if engagement_type == "NOTE":
-            return metadata.get("body", "")
-        elif engagement_type == "EMAIL":
-            return self._format_email_content(metadata)
-        elif engagement_type == "TASK":
-            return self._format_task_content(metadata)
-        elif engagement_type == "MEETING":
-            return self._format_meeting_content(metadata)
-        elif engagement_type == "CALL":
-            return self._format_call_content(metadata)
-        return {}
+        formatter = self._content_formatters.get(engagement_type)
+        if formatter is None:
+            return {}
+        return formatter(metadata)
+    
+    def _format_note_content(self, metadata: Dict[str, Any]) -> str:
+        """Format note-specific content.
+        
+        Args:
+            metadata: Note metadata
+            
+        Returns:
+            Note body
+        """
+        return metadata.get("body", "")
     
     def _format_email_content(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
         """Format email-specific content.
@@ -200,15 +569,14 @@ class CompanyClient:
         Returns:
             Formatted email content
         """
+        format_participant = self._format_email_participant
         return {
             "subject": metadata.get("subject", ""),
-            "from": self._format_email_participant(metadata.get("from", {})),
-            "to": [self._format_email_participant(recipient) 
-                  for recipient in metadata.get("to", [])],
-            "cc": [self._format_email_participant(recipient) 
-                 for recipient in metadata.get("cc", [])],
-            "bcc": [self._format_email_participant(recipient) 
-                  for recipient in metadata.get("bcc", [])],
+            "from": format_participant(metadata.get("from", {})),
+            **{
+                field: [format_participant(recipient) for recipient in metadata.get(field, ())]
+                for field in EMAIL_RECIPIENT_FIELDS
+            },
             "sender": {
                 "email": metadata.get("sender", {}).get("email", "")
             },
@@ -224,12 +592,7 @@ class CompanyClient:
         Returns:
             Formatted participant
         """
-        return {
-            "raw": participant.get("raw", ""),
-            "email": participant.get("email", ""),
-            "firstName": participant.get("firstName", ""),
-            "lastName": participant.get("lastName", "")
-        }
+        return {field: participant.get(field, "") for field in EMAIL_PARTICIPANT_FIELDS}
     
     def _format_task_content(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
         """Format task-specific content.
@@ -1,31 +1,83 @@
 """
 Client for HubSpot contact-related operations.
 """
-import json
 import logging
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 
+import requests
 from hubspot import HubSpot
 from hubspot.crm.contacts import PublicObjectSearchRequest, SimplePublicObjectInputForCreate
 from hubspot.crm.contacts.exceptions import ApiException
 
-from ..core.formatters import convert_datetime_fields
+from ..core.formatters import project_crm_object
+from ..core.serialization import dumps
 from ..core.error_handler import handle_hubspot_errors
+from ..core.cache import TTLCache, ttl_cached
+from ..core.http import create_session, send_api_request
+from ..core.rate_limiter import get_rate_limiter
 
 logger = logging.getLogger('mcp_hubspot_client.contact')
 
+# Largest page requested from the CRM search API
+SEARCH_PAGE_SIZE = 100
+
+# Sort order and properties of recent-activity searches (constant across calls)
+RECENT_SEARCH_SORTS = ({"propertyName": "lastmodifieddate", "direction": "DESCENDING"},)
+RECENT_SEARCH_PROPERTIES = ("firstname", "lastname", "email", "phone", "company", "hs_lastmodifieddate")
+
+# Seconds to reuse get_recent results for identical calls
+RECENT_CACHE_TTL = 30
+
+# Seconds to reuse duplicate-contact lookups, and how many to keep
+EXISTING_CONTACT_CACHE_TTL = 60
+EXISTING_CONTACT_CACHE_SIZE = 512
+
+# Properties returned by duplicate-contact lookups
+EXISTING_CONTACT_PROPERTIES = ("firstname", "lastname", "email", "hs_object_id")
+
+# Search filters used to find an existing contact; "value" is filled in per call
+FIRSTNAME_FILTER_TEMPLATE = {"propertyName": "firstname", "operator": "EQ"}
+LASTNAME_FILTER_TEMPLATE = {"propertyName": "lastname", "operator": "EQ"}
+COMPANY_FILTER_TEMPLATE = {"propertyName": "company", "operator": "EQ"}
+
+# HubSpot batch create accepts at most 100 inputs per call
+CONTACT_BATCH_SIZE = 100
+
+# Maximum number of contact batches processed at once
+CONTACT_BATCH_WORKERS = 4
+
+# Properties returned by batch duplicate-contact lookups
+BATCH_EXISTING_CONTACT_PROPERTIES = ("firstname", "lastname", "company", "email", "hs_object_id")
+
 class ContactClient:
     """Client for HubSpot contact-related operations."""
     
-    def __init__(self, hubspot_client: HubSpot, access_token: str):
+    def __init__(
+        self, 
+        hubspot_client: HubSpot, 
+        access_token: str, 
+        session: Optional[requests.Session] = None
+    ):
         """Initialize with HubSpot client instance.
         
         Args:
             hubspot_client: Initialized HubSpot client
             access_token: HubSpot API access token
+            session: Pooled HTTP session for raw API requests (default: a new session)
         """
         self.client = hubspot_client
         self.access_token = access_token
+        self.session = session or create_session()
+        self.rate_limiter = get_rate_limiter(access_token)
+        self._recent_cache = TTLCache(ttl=RECENT_CACHE_TTL)
+        self._existing_contact_cache = TTLCache(
+            ttl=EXISTING_CONTACT_CACHE_TTL, maxsize=EXISTING_CONTACT_CACHE_SIZE
+        )
+    
+    def invalidate_recent(self) -> None:
+        """Discard cached get_recent results, e.g. after a contact is created."""
+        self._recent_cache.clear()
     
     @handle_hubspot_errors
     def get_recent(self, limit: int = 10) -> str:
@@ -37,43 +89,89 @@ class ContactClient:
         Returns:
             JSON string with contact data
         """
-        search_request = self._create_contact_search_request(limit)
-        search_response = self.client.crm.contacts.search_api.do_search(
-            public_object_search_request=search_request
-        )
+        return dumps(self.get_recent_data(limit))
+    
+    @ttl_cached("_recent_cache")
+    def get_recent_data(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Get most recently active contacts from HubSpot as parsed data.
+        
+        Args:
+            limit: Maximum number of contacts to return (default: 10)
+            
+        Returns:
+            List of contact dictionaries
+            
+        Raises:
+            ApiException: If the HubSpot API request fails
+        """
+        return [
+            project_crm_object(contact, RECENT_SEARCH_PROPERTIES)
+            for contact in self._search_recent_contacts(limit)
+        ]
+    
+    def _search_recent_contacts(self, limit: int) -> List[Any]:
+        """Search for recently modified contacts, one page of at most SEARCH_PAGE_SIZE at a time.
+        
+        Args:
+            limit: Maximum number of contacts to return
+            
+        Returns:
+            List of contact objects from the search API
+        """
+        contacts = []
+        after = None
         
-        contacts_dict = [contact.to_dict() for contact in search_response.results]
-        converted_contacts = convert_datetime_fields(contacts_dict)
-        return json.dumps(converted_contacts)
+        while len(contacts) < limit:
+            search_request = self._create_contact_search_request(
+                min(SEARCH_PAGE_SIZE, limit - len(contacts)), after
+            )
+            with self.rate_limiter:
+                search_response = self.client.crm.contacts.search_api.do_search(
+                    public_object_search_request=search_request
+                )
+            contacts.extend(search_response.results)
+            
+            paging = getattr(search_response, "paging", None)
+            after = paging.next.after if paging and paging.next else None
+            if not after or not search_response.results:
+                break
+        
+        return contacts
     
-    def _create_contact_search_request(self, limit: int) -> PublicObjectSearchRequest:
+    def _create_contact_search_request(
+        self, 
+        limit: int, 
+        after: Optional[str] = None
+    ) -> PublicObjectSearchRequest:
         """Create a search request for contacts sorted by last modified date.
         
         Args:
             limit: Maximum number of results to return
+            after: Pagination cursor from a previous search page (default: None)
             
         Returns:
             Configured search request object
         """
         return PublicObjectSearchRequest(
-            sorts=[{
-                "propertyName": "lastmodifieddate",
-                "direction": "DESCENDING"
-            }],
+            sorts=RECENT_SEARCH_SORTS,
             limit=limit,
-            properties=["firstname", "lastname", "email", "phone", "company", 
-                       "hs_lastmodifieddate", "lastmodifieddate"]
+            after=after,
+            properties=RECENT_SEARCH_PROPERTIES
         )
     
-    @handle_hubspot_errors
     def create_contact(self, properties: Dict[str, Any]) -> Dict[str, Any]:
-        """Create a new contact in HubSpot.
+        """Create a new contact in HubSpot unless one with the same name exists.
         
         Args:
             properties: Contact properties including first name, last name, email, etc.
             
         Returns:
-            Dictionary with the created contact or error information
+            Dictionary with the created contact, or {"already_exists": True,
+            "contact": ...} with the existing contact matching the name (and
+            company, when given)
+            
+        Raises:
+            ApiException: If the HubSpot API request fails
         """
         # Check if contact already exists
         if "firstname" in properties and "lastname" in properties:
@@ -91,12 +189,17 @@ class ContactClient:
             properties=properties
         )
         
-        api_response = self.client.crm.contacts.basic_api.create(
-            simple_public_object_input_for_create=simple_public_object_input
-        )
+        with self.rate_limiter:
+            api_response = self.client.crm.contacts.basic_api.create(
+                simple_public_object_input_for_create=simple_public_object_input
+            )
+        self.invalidate_recent()
+        self._existing_contact_cache.clear()
         
         return api_response.to_dict()
     
+    # Misses are not cached, so a contact created meanwhile by another caller is found
+    @ttl_cached("_existing_contact_cache", cache_none=False)
     def _find_existing_contact(
         self, 
         firstname: str, 
@@ -113,38 +216,208 @@ class ContactClient:
         Returns:
             Existing contact data if found, None otherwise
         """
+        filters = [
+            {**FIRSTNAME_FILTER_TEMPLATE, "value": firstname},
+            {**LASTNAME_FILTER_TEMPLATE, "value": lastname}
+        ]
+        
+        # Add company filter if provided
+        if company:
+            filters.append({**COMPANY_FILTER_TEMPLATE, "value": company})
+        
+        search_request = PublicObjectSearchRequest(
+            filter_groups=[{"filters": filters}],
+            limit=1,
+            properties=EXISTING_CONTACT_PROPERTIES
+        )
+        
+        with self.rate_limiter:
+            search_response = self.client.crm.contacts.search_api.do_search(
+                public_object_search_request=search_request
+            )
+        
+        if search_response.total > 0:
+            return search_response.results[0].to_dict()
+            
+        return None
+    
+    def create_contacts(self, contacts: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Create multiple contacts in HubSpot, skipping existing ones.
+        
+        Contacts are processed in batches of CONTACT_BATCH_SIZE. Each batch
+        needs one search to find existing contacts and one batch create call,
+        and batches are processed concurrently. A failing batch does not stop
+        the others, so the result may be a partial success.
+        
+        Args:
+            contacts: List of contact properties (first name, last name, email, etc.)
+            
+        Returns:
+            Dictionary with the created contacts, the existing contacts that
+            matched inputs by name (and company, when given), and the errors of
+            records or whole batches that could not be created
+        """
+        batches = [
+            contacts[i:i + CONTACT_BATCH_SIZE]
+            for i in range(0, len(contacts), CONTACT_BATCH_SIZE)
+        ]
+        
+        created: List[Dict[str, Any]] = []
+        already_exists: List[Dict[str, Any]] = []
+        errors: List[Dict[str, Any]] = []
+        with ThreadPoolExecutor(max_workers=CONTACT_BATCH_WORKERS) as executor:
+            futures = [(batch, executor.submit(self._create_contact_batch, batch)) for batch in batches]
+            for batch, future in futures:
+                try:
+                    batch_created, batch_existing, batch_errors = future.result()
+                except Exception as e:
+                    logger.error(f"Error creating batch of {len(batch)} contacts: {str(e)}")
+                    errors.append({"message": str(e), "inputs": batch})
+                    continue
+                created.extend(batch_created)
+                already_exists.extend(batch_existing)
+                errors.extend(batch_errors)
+        
+        if created:
+            self.invalidate_recent()
+            self._existing_contact_cache.clear()
+        
+        return {"results": created, "already_exists": already_exists, "errors": errors}
+    
+    def _create_contact_batch(
+        self, 
+        contacts: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Create one batch of contacts, skipping those that already exist.
+        
+        Args:
+            contacts: List of contact properties (at most CONTACT_BATCH_SIZE)
+            
+        Returns:
+            Tuple of (created contacts, matching existing contacts, errors of
+            records HubSpot rejected within a multi-status response)
+            
+        Raises:
+            requests.HTTPError: If the batch create request fails as a whole
+        """
+        existing_by_name = self._find_existing_contacts(contacts)
+        
+        new_contacts = []
+        already_exists = []
+        for properties in contacts:
+            existing_contact = self._match_existing_contact(properties, existing_by_name)
+            if existing_contact:
+                already_exists.append(existing_contact)
+            else:
+                new_contacts.append(properties)
+        
+        if not new_contacts:
+            return [], already_exists, []
+        
+        with self.rate_limiter:
+            response = send_api_request(self.session, self.client, {
+                "method": "POST",
+                "path": "/crm/v3/objects/contacts/batch/create",
+                "body": {"inputs": [{"properties": properties} for properties in new_contacts]}
+            })
+        response.raise_for_status()
+        
+        body = response.json()
+        errors = body.get("errors", [])
+        if errors:
+            logger.warning(f"{len(errors)} of {len(new_contacts)} contacts in a batch were not created")
+        return body.get("results", []), already_exists, errors
+    
+    def _find_existing_contacts(
+        self, 
+        contacts: List[Dict[str, Any]]
+    ) -> Dict[Tuple[str, str], List[Dict[str, Any]]]:
+        """Search for existing contacts sharing a name with any of the given contacts.
+        
+        Uses a single search with IN filters on first and last name, so the
+        result may include extra name combinations; exact pairs are matched
+        afterwards by _match_existing_contact.
+        
+        Args:
+            contacts: List of contact properties
+            
+        Returns:
+            Existing contacts keyed by lowercased (first name, last name)
+        """
+        named_contacts = [
+            properties for properties in contacts
+            if "firstname" in properties and "lastname" in properties
+        ]
+        if not named_contacts:
+            return {}
+        
+        # String values of IN filters must be lowercase
         filter_group = {
             "filters": [
                 {
                     "propertyName": "firstname",
-                    "operator": "EQ",
-                    "value": firstname
+                    "operator": "IN",
+                    "values": sorted({str(c["firstname"]).lower() for c in named_contacts})
                 },
                 {
                     "propertyName": "lastname",
-                    "operator": "EQ",
-                    "value": lastname
+                    "operator": "IN",
+                    "values": sorted({str(c["lastname"]).lower() for c in named_contacts})
                 }
             ]
         }
         
-        # Add company filter if provided
-        if company:
-            filter_group["filters"].append({
-                "propertyName": "company",
-                "operator": "EQ",
-                "value": company
-            })
-        
-        search_request = PublicObjectSearchRequest(
-            filter_groups=[filter_group]
-        )
+        existing_by_name: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        after = None
+        while True:
+            search_request = PublicObjectSearchRequest(
+                filter_groups=[filter_group],
+                limit=SEARCH_PAGE_SIZE,
+                after=after,
+                properties=BATCH_EXISTING_CONTACT_PROPERTIES
+            )
+            with self.rate_limiter:
+                search_response = self.client.crm.contacts.search_api.do_search(
+                    public_object_search_request=search_request
+                )
+            
+            for contact in search_response.results:
+                contact_dict = project_crm_object(contact, BATCH_EXISTING_CONTACT_PROPERTIES)
+                contact_properties = contact_dict["properties"]
+                key = (
+                    str(contact_properties.get("firstname") or "").lower(),
+                    str(contact_properties.get("lastname") or "").lower()
+                )
+                existing_by_name.setdefault(key, []).append(contact_dict)
+            
+            paging = getattr(search_response, "paging", None)
+            after = paging.next.after if paging and paging.next else None
+            if not after or not search_response.results:
+                break
         
-        search_response = self.client.crm.contacts.search_api.do_search(
-            public_object_search_request=search_request
-        )
+        return existing_by_name
+    
+    def _match_existing_contact(
+        self, 
+        properties: Dict[str, Any], 
+        existing_by_name: Dict[Tuple[str, str], List[Dict[str, Any]]]
+    ) -> Optional[Dict[str, Any]]:
+        """Find the existing contact matching a new contact's name and company.
         
-        if search_response.total > 0:
-            return search_response.results[0].to_dict()
+        Args:
+            properties: New contact properties
+            existing_by_name: Existing contacts keyed by lowercased (first name, last name)
             
+        Returns:
+            Matching existing contact, or None
+        """
+        if "firstname" not in properties or "lastname" not in properties:
+            return None
+        
+        key = (str(properties["firstname"]).lower(), str(properties["lastname"]).lower())
+        company = properties.get("company")
+        for existing_contact in existing_by_name.get(key, ()):
+            existing_company = (existing_contact.get("properties") or {}).get("company")
+            if not company or str(existing_company or "").lower() == str(company).lower():
+                return existing_contact
         return None
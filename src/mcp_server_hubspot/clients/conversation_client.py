@@ -4,32 +4,93 @@ Client for HubSpot conversation-related operations.
 import json
 import logging
 import requests
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence
 
 from hubspot import HubSpot
 from hubspot.crm.objects.emails import BatchReadInputSimplePublicObjectId, SimplePublicObjectId
 from hubspot.crm.contacts.exceptions import ApiException
 
-from ..core.formatters import convert_datetime_fields
+from ..core.serialization import loads
 from ..core.error_handler import handle_hubspot_errors
+from ..core.cache import TTLCache
+from ..core.http import create_session
+from ..core.rate_limiter import get_rate_limiter
 from ..core.storage import ThreadStorage
 
 logger = logging.getLogger('mcp_hubspot_client.conversation')
 
+# HubSpot API limit for email batch reads
+EMAIL_BATCH_SIZE = 10
+
+# Email properties read for each email
+EMAIL_BATCH_PROPERTIES = (
+    "subject", "hs_email_text", "hs_email_from",
+    "hs_email_to", "hs_email_cc", "hs_email_bcc", "createdAt", "updatedAt"
+)
+
+# Email properties read only for emails without a text body
+EMAIL_HTML_PROPERTIES = ("hs_email_html",)
+
+# Maximum number of concurrent email batch reads
+EMAIL_BATCH_WORKERS = 8
+
+# Maximum number of concurrent thread message requests
+THREAD_MESSAGES_FETCH_WORKERS = 10
+
+# Thread fields read by _format_thread
+THREAD_FIELDS = (
+    "id", "createdAt", "status", "inboxId", "associatedContactId",
+    "spam", "archived", "assignedTo", "latestMessageTimestamp"
+)
+
+# Message fields read by _format_message
+MESSAGE_FIELDS = (
+    "id", "createdAt", "updatedAt", "senders", "recipients", "subject", "text",
+    "richText", "status", "direction", "channelId", "channelAccountId"
+)
+
+# Maximum age of the on-disk first page of threads, in seconds
+THREADS_CACHE_MAX_AGE = 300
+
+# How long to keep ETags and bodies of fetched thread pages for revalidation
+THREADS_ETAG_CACHE_TTL = 3600
+
+# Cache thread messages per (thread ID, latest message timestamp)
+THREAD_MESSAGES_CACHE_TTL = 300
+THREAD_MESSAGES_CACHE_SIZE = 1024
+
 class ConversationClient:
     """Client for HubSpot conversation-related operations."""
     
-    def __init__(self, hubspot_client: HubSpot, access_token: str, thread_storage: ThreadStorage):
+    def __init__(
+        self, 
+        hubspot_client: HubSpot, 
+        access_token: str, 
+        thread_storage: ThreadStorage, 
+        session: Optional[requests.Session] = None
+    ):
         """Initialize with HubSpot client instance.
         
         Args:
             hubspot_client: Initialized HubSpot client
             access_token: HubSpot API access token
             thread_storage: Storage handler for conversation threads
+            session: Pooled HTTP session for raw API requests (default: a new session)
         """
         self.client = hubspot_client
         self.access_token = access_token
         self.thread_storage = thread_storage
+        self.session = session or create_session()
+        self._headers = {
+            'accept': "application/json",
+            'authorization': f"Bearer {access_token}"
+        }
+        self.rate_limiter = get_rate_limiter(access_token)
+        self._messages_cache = TTLCache(
+            ttl=THREAD_MESSAGES_CACHE_TTL, maxsize=THREAD_MESSAGES_CACHE_SIZE
+        )
+        self._threads_etags = TTLCache(ttl=THREADS_ETAG_CACHE_TTL)
     
     @handle_hubspot_errors
     def get_recent_emails(self, limit: int = 10, after: Optional[str] = None) -> Dict[str, Any]:
@@ -72,11 +133,12 @@ class ConversationClient:
         Returns:
             API response with email results
         """
-        return self.client.crm.objects.emails.basic_api.get_page(
-            limit=limit, 
-            archived=False,
-            after=after
-        )
+        with self.rate_limiter:
+            return self.client.crm.objects.emails.basic_api.get_page(
+                limit=limit, 
+                archived=False,
+                after=after
+            )
     
     def _create_empty_email_response(self, api_response: Any) -> Dict[str, Any]:
         """Create an empty email response structure with pagination.
@@ -87,94 +149,140 @@ class ConversationClient:
         Returns:
             Empty response structure with pagination
         """
-        next_after = None
-        if hasattr(api_response, 'paging') and hasattr(api_response.paging, 'next'):
-            next_after = api_response.paging.next.after
-            
         return {
             "results": [],
             "pagination": {
-                "next": {"after": next_after}
+                "next": {"after": self._extract_pagination_token(api_response)}
             }
         }
     
     def _get_email_details(self, email_ids: List[str]) -> List[Dict[str, Any]]:
         """Get detailed content for each email.
         
+        Batches are read concurrently; results keep the order of email_ids.
+        
         Args:
             email_ids: List of email IDs to retrieve details for
             
         Returns:
             List of formatted email details
         """
-        formatted_emails = []
-        batch_size = 10  # HubSpot API limit for batch operations
+        batches = [
+            email_ids[i:i + EMAIL_BATCH_SIZE]
+            for i in range(0, len(email_ids), EMAIL_BATCH_SIZE)
+        ]
         
-        for i in range(0, len(email_ids), batch_size):
-            batch_ids = email_ids[i:i+batch_size]
-            logger.debug(f"Processing batch of {len(batch_ids)} emails")
-            
-            try:
-                batch_response = self._fetch_email_batch(batch_ids)
-                formatted_batch = self._format_email_batch(batch_response)
+        formatted_emails = []
+        with ThreadPoolExecutor(max_workers=min(EMAIL_BATCH_WORKERS, len(batches))) as executor:
+            for formatted_batch in executor.map(self._get_email_batch, batches):
                 formatted_emails.extend(formatted_batch)
-            except ApiException as e:
-                logger.error(f"Batch API Exception: {str(e)}")
         
-        # Convert datetime fields
-        return convert_datetime_fields(formatted_emails)
+        # Email properties are plain strings, so no datetime conversion is needed
+        return formatted_emails
+    
+    def _get_email_batch(self, batch_ids: List[str]) -> List[Dict[str, Any]]:
+        """Fetch and format a batch of emails.
+        
+        Args:
+            batch_ids: List of email IDs to retrieve
+            
+        Returns:
+            List of formatted emails, empty if the request failed
+        """
+        logger.debug(f"Processing batch of {len(batch_ids)} emails")
+        try:
+            batch_response = self._fetch_email_batch(batch_ids)
+            html_bodies = self._fetch_email_html_bodies(batch_response)
+            return self._format_email_batch(batch_response, html_bodies)
+        except ApiException as e:
+            logger.error(f"Batch API Exception: {str(e)}")
+            return []
     
-    def _fetch_email_batch(self, batch_ids: List[str]) -> Any:
+    def _fetch_email_batch(
+        self, 
+        batch_ids: List[str], 
+        properties: Sequence[str] = EMAIL_BATCH_PROPERTIES
+    ) -> Any:
         """Fetch details for a batch of emails.
         
         Args:
             batch_ids: List of email IDs to retrieve
+            properties: Email properties to read (default: EMAIL_BATCH_PROPERTIES)
             
         Returns:
             Batch API response
         """
         batch_input = BatchReadInputSimplePublicObjectId(
             inputs=[SimplePublicObjectId(id=email_id) for email_id in batch_ids],
-            properties=[
-                "subject", "hs_email_text", "hs_email_html", "hs_email_from",
-                "hs_email_to", "hs_email_cc", "hs_email_bcc", "createdAt", "updatedAt"
-            ]
+            properties=properties
         )
         
-        return self.client.crm.objects.emails.batch_api.read(
-            batch_read_input_simple_public_object_id=batch_input
-        )
+        with self.rate_limiter:
+            return self.client.crm.objects.emails.batch_api.read(
+                batch_read_input_simple_public_object_id=batch_input
+            )
+    
+    def _fetch_email_html_bodies(self, batch_response: Any) -> Dict[str, Any]:
+        """Fetch HTML bodies for the emails in a batch that have no text body.
+        
+        HTML bodies are much larger than text bodies, so they are only read
+        for the emails that need them as a fallback.
+        
+        Args:
+            batch_response: Batch API response with text bodies
+            
+        Returns:
+            Dictionary mapping email IDs to HTML bodies
+        """
+        missing_ids = [
+            email.id for email in batch_response.results
+            if not (email.properties or {}).get("hs_email_text")
+        ]
+        if not missing_ids:
+            return {}
+        
+        html_response = self._fetch_email_batch(missing_ids, EMAIL_HTML_PROPERTIES)
+        return {
+            email.id: (email.properties or {}).get("hs_email_html", "")
+            for email in html_response.results
+        }
     
-    def _format_email_batch(self, batch_response: Any) -> List[Dict[str, Any]]:
+    def _format_email_batch(self, batch_response: Any, html_bodies: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Format a batch of email responses.
         
         Args:
             batch_response: Batch API response
+            html_bodies: HTML bodies of emails without a text body, by email ID
             
         Returns:
             List of formatted emails
         """
-        formatted_emails = []
+        return [self._format_email(email, html_bodies) for email in batch_response.results]
+    
+    def _format_email(self, email: Any, html_bodies: Dict[str, Any]) -> Dict[str, Any]:
+        """Format a single email from a batch response.
         
-        for email in batch_response.results:
-            email_dict = email.to_dict()
-            properties = email_dict.get("properties", {})
-            
-            formatted_email = {
-                "id": email_dict.get("id"),
-                "created_at": properties.get("createdAt"),
-                "updated_at": properties.get("updatedAt"),
-                "subject": properties.get("subject", ""),
-                "from": properties.get("hs_email_from", ""),
-                "to": properties.get("hs_email_to", ""),
-                "cc": properties.get("hs_email_cc", ""),
-                "bcc": properties.get("hs_email_bcc", ""),
-                "body": properties.get("hs_email_text", "") or properties.get("hs_email_html", "")
-            }
-            
-            formatted_emails.append(formatted_email)
+        Args:
+            email: Email object from the batch API response
+            html_bodies: HTML bodies of emails without a text body, by email ID
             
-        return formatted_emails
+        Returns:
+            Formatted email
+        """
+        # Read the SDK model directly; to_dict() would copy every attribute first
+        properties = email.properties or {}
+        
+        return {
+            "id": email.id,
+            "created_at": properties.get("createdAt"),
+            "updated_at": properties.get("updatedAt"),
+            "subject": properties.get("subject", ""),
+            "from": properties.get("hs_email_from", ""),
+            "to": properties.get("hs_email_to", ""),
+            "cc": properties.get("hs_email_cc", ""),
+            "bcc": properties.get("hs_email_bcc", ""),
+            "body": properties.get("hs_email_text", "") or html_bodies.get(email.id, "")
+        }
     
     def _extract_pagination_token(self, api_response: Any) -> Optional[str]:
         """Extract the pagination token from an API response.
@@ -185,8 +293,9 @@ class ConversationClient:
         Returns:
             Pagination token or None
         """
-        if hasattr(api_response, 'paging') and hasattr(api_response.paging, 'next'):
-            return api_response.paging.next.after
+        paging = getattr(api_response, "paging", None)
+        if paging and paging.next:
+            return paging.next.after
         return None
     
     @handle_hubspot_errors
@@ -217,11 +326,9 @@ class ConversationClient:
         formatted_threads = self._get_thread_messages(thread_results)
         next_after = threads_data.get("paging", {}).get("next", {}).get("after")
         
-        # Convert datetime fields
-        converted_threads = convert_datetime_fields(formatted_threads)
-        
+        # Thread data is decoded JSON, so timestamps are already ISO strings
         return {
-            "results": converted_threads,
+            "results": formatted_threads,
             "pagination": {
                 "next": {"after": next_after}
             }
@@ -243,8 +350,13 @@ class ConversationClient:
         Returns:
             Thread data
         """
-        # Use cached threads unless refresh_cache is True or we're paginating
-        if not refresh_cache and not after and self.thread_storage.get_cached_threads().get("results"):
+        # Use cached threads unless refresh_cache is True, we're paginating or the cache is stale
+        if (
+            not refresh_cache
+            and not after
+            and self.thread_storage.get_cached_threads().get("results")
+            and self.thread_storage.is_fresh(THREADS_CACHE_MAX_AGE)
+        ):
             logger.info("Using cached threads")
             return self.thread_storage.get_cached_threads()
         
@@ -261,12 +373,15 @@ class ConversationClient:
     def _fetch_threads_page(self, limit: int, after: Optional[str]) -> Dict[str, Any]:
         """Fetch a page of conversation threads from HubSpot.
         
+        Pages are revalidated with If-None-Match when HubSpot returned an ETag
+        for the same request, so unchanged pages come back as an empty 304.
+        
         Args:
             limit: Maximum number of threads to return
             after: Pagination token
             
         Returns:
-            API response with thread results
+            API response with thread results, trimmed to THREAD_FIELDS
         """
         url = "https://api.hubapi.com/conversations/v3/conversations/threads"
         
@@ -274,13 +389,31 @@ class ConversationClient:
         if after:
             params["after"] = after
         
-        headers = {
-            'accept': "application/json",
-            'authorization': f"Bearer {self.access_token}"
-        }
+        headers = self._headers
+        cached_page = self._threads_etags.get((limit, after))
+        if cached_page is not None:
+            headers = {**headers, "If-None-Match": cached_page[0]}
+        
+        with self.rate_limiter:
+            response = self.session.get(url, headers=headers, params=params)
+        
+        if response.status_code == 304 and cached_page is not None:
+            logger.debug(f"Threads page unchanged for limit={limit}, after={after}")
+            return cached_page[1]
+        
+        threads_response = loads(response.content)
         
-        response = requests.request("GET", url, headers=headers, params=params)
-        return response.json()
+        # Keep only the thread fields that get formatted, which also shrinks the on-disk cache
+        if "results" in threads_response:
+            threads_response["results"] = [
+                {field: thread[field] for field in THREAD_FIELDS if field in thread}
+                for thread in threads_response["results"]
+            ]
+        
+        etag = response.headers.get("ETag")
+        if etag and response.ok:
+            self._threads_etags.set((limit, after), (etag, threads_response))
+        return threads_response
     
     def _create_empty_threads_response(self, threads_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create an empty threads response structure with pagination.
@@ -301,36 +434,54 @@ class ConversationClient:
     def _get_thread_messages(self, thread_results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Get messages for each thread and format them.
         
+        Messages for all threads are fetched concurrently; results keep the
+        order of thread_results.
+        
         Args:
             thread_results: List of thread data
             
         Returns:
             List of formatted threads with their messages
         """
-        formatted_threads = []
+        threads = [thread for thread in thread_results if thread.get("id")]
+        if not threads:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(THREAD_MESSAGES_FETCH_WORKERS, len(threads))) as executor:
+            formatted_threads = executor.map(self._get_formatted_thread, threads)
+            return [thread for thread in formatted_threads if thread is not None]
+    
+    def _get_formatted_thread(self, thread: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Fetch a thread's messages and format the thread with them.
         
-        for thread in thread_results:
-            thread_id = thread.get("id")
-            if not thread_id:
-                continue
+        Args:
+            thread: Thread data
             
-            # Get the messages for this thread
-            try:
+        Returns:
+            Formatted thread with its messages, or None if the request failed
+        """
+        thread_id = thread["id"]
+        try:
+            # A thread's messages only change when its latest message does
+            cache_key = (thread_id, thread.get("latestMessageTimestamp"))
+            actual_messages = self._messages_cache.get(cache_key)
+            if actual_messages is None:
                 messages_response = self._fetch_thread_messages(thread_id)
                 
                 # Format thread with its messages
                 message_results = messages_response.get("results", [])
                 
-                # Only keep actual messages (not system messages)
-                actual_messages = [msg for msg in message_results if msg.get("type") == "MESSAGE"]
-                
-                formatted_thread = self._format_thread(thread, actual_messages)
-                formatted_threads.append(formatted_thread)
-                
-            except Exception as e:
-                logger.error(f"Error fetching messages for thread {thread_id}: {str(e)}")
-        
-        return formatted_threads
+                # Only keep actual messages (not system messages), trimmed to the formatted fields
+                actual_messages = [
+                    {field: msg[field] for field in MESSAGE_FIELDS if field in msg}
+                    for msg in message_results if msg.get("type") == "MESSAGE"
+                ]
+                self._messages_cache.set(cache_key, actual_messages)
+            
+            return self._format_thread(thread, actual_messages)
+        except Exception as e:
+            logger.error(f"Error fetching messages for thread {thread_id}: {str(e)}")
+            return None
     
     def _fetch_thread_messages(self, thread_id: str) -> Dict[str, Any]:
         """Fetch messages for a specific thread.
@@ -343,13 +494,9 @@ class ConversationClient:
         """
         url = f"https://api.hubapi.com/conversations/v3/conversations/threads/{thread_id}/messages"
         
-        headers = {
-            'accept': "application/json",
-            'authorization': f"Bearer {self.access_token}"
-        }
-        
-        response = requests.request("GET", url, headers=headers)
-        return response.json()
+        with self.rate_limiter:
+            response = self.session.get(url, headers=self._headers)
+        return loads(response.content)
     
     def _format_thread(
         self, 
@@ -375,14 +522,9 @@ class ConversationClient:
             "archived": thread.get("archived", False),
             "assigned_to": thread.get("assignedTo"),
             "latest_message_timestamp": thread.get("latestMessageTimestamp"),
-            "messages": []
+            "messages": [self._format_message(msg) for msg in messages]
         }
         
-        # Add formatted messages
-        for msg in messages:
-            formatted_message = self._format_message(msg)
-            formatted_thread["messages"].append(formatted_message)
-        
         return formatted_thread
     
     def _format_message(self, msg: Dict[str, Any]) -> Dict[str, Any]:
@@ -394,22 +536,22 @@ class ConversationClient:
         Returns:
             Formatted message
         """
-        sender_info = self._extract_sender_info(msg)
-        recipients_info = self._extract_recipients_info(msg)
+        get = msg.get
+        status = get("status") or {}
         
         return {
-            "id": msg.get("id"),
-            "created_at": msg.get("createdAt"),
-            "updated_at": msg.get("updatedAt"),
-            "sender": sender_info,
-            "recipients": recipients_info,
-            "subject": msg.get("subject", ""),
-            "text": msg.get("text", ""),
-            "rich_text": msg.get("richText", ""),
-            "status": msg.get("status", {}).get("statusType", ""),
-            "direction": msg.get("direction", ""),
-            "channel_id": msg.get("channelId", ""),
-            "channel_account_id": msg.get("channelAccountId", "")
+            "id": get("id"),
+            "created_at": get("createdAt"),
+            "updated_at": get("updatedAt"),
+            "sender": self._extract_sender_info(msg),
+            "recipients": self._extract_recipients_info(msg),
+            "subject": get("subject", ""),
+            "text": get("text", ""),
+            "rich_text": get("richText", ""),
+            "status": status.get("statusType", ""),
+            "direction": get("direction", ""),
+            "channel_id": get("channelId", ""),
+            "channel_account_id": get("channelAccountId", "")
         }
     
     def _extract_sender_info(self, msg: Dict[str, Any]) -> Dict[str, Any]:
@@ -421,17 +563,20 @@ class ConversationClient:
         Returns:
             Sender information
         """
-        sender_info = {}
-        if msg.get("senders") and len(msg.get("senders")) > 0:
-            sender = msg.get("senders")[0]
-            sender_info = {
-                "actor_id": sender.get("actorId", ""),
-                "name": sender.get("name", ""),
-                "sender_field": sender.get("senderField", ""),
-                "email": sender.get("deliveryIdentifier", {}).get("value", "") 
-                        if sender.get("deliveryIdentifier", {}).get("type") == "HS_EMAIL_ADDRESS" 
-                        else ""
-            }
+        senders = msg.get("senders")
+        if not senders:
+            return {}
+        
+        sender = senders[0]
+        delivery_identifier = sender.get("deliveryIdentifier") or {}
+        sender_info = {
+            "actor_id": sender.get("actorId", ""),
+            "name": sender.get("name", ""),
+            "sender_field": sender.get("senderField", ""),
+            "email": delivery_identifier.get("value", "")
+                    if delivery_identifier.get("type") == "HS_EMAIL_ADDRESS"
+                    else ""
+        }
         return sender_info
     
     def _extract_recipients_info(self, msg: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -444,10 +589,11 @@ class ConversationClient:
             List of recipient information
         """
         recipients_info = []
-        for recipient in msg.get("recipients", []):
-            if recipient.get("deliveryIdentifier", {}).get("type") == "HS_EMAIL_ADDRESS":
+        for recipient in msg.get("recipients", ()):
+            delivery_identifier = recipient.get("deliveryIdentifier") or {}
+            if delivery_identifier.get("type") == "HS_EMAIL_ADDRESS":
                 recipients_info.append({
                     "recipient_field": recipient.get("recipientField", ""),
-                    "email": recipient.get("deliveryIdentifier", {}).get("value", "")
+                    "email": delivery_identifier.get("value", "")
                 })
         return recipients_info
@@ -3,8 +3,11 @@ Client for HubSpot ticket-related operations.
 """
 import json
 import logging
+import random
 import time
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from typing import Any, Dict, List, Optional, Literal
 from datetime import datetime, timedelta
 
@@ -14,21 +17,84 @@ from hubspot.crm.contacts.exceptions import ApiException
 
 from ..core.formatters import convert_datetime_fields
 from ..core.error_handler import handle_hubspot_errors
+from ..core.cache import TTLCache, ttl_cached
+from ..core.http import create_session
+from ..core.rate_limiter import get_rate_limiter
 
 logger = logging.getLogger('mcp_hubspot_client.ticket')
 
+# Filter groups for the "Closed" criteria (either group can match)
+CLOSED_CRITERIA_FILTER_GROUPS = (
+    # Primary approach: using the pipeline stage ID
+    {
+        "filters": [
+            {
+                "propertyName": "hs_pipeline_stage",
+                "operator": "EQ",
+                "value": "4"  # Using the stage ID from the pipeline data
+            }
+        ]
+    },
+    # Alternative approach: using the properly capitalized stage name
+    {
+        "filters": [
+            {
+                "propertyName": "hs_pipeline_stage",
+                "operator": "EQ",
+                "value": "Closed"  # Using correct capitalization
+            }
+        ]
+    }
+)
+
+# Sort order and properties for ticket searches
+TICKET_SEARCH_SORTS = ({"propertyName": "hs_lastmodifieddate", "direction": "DESCENDING"},)
+TICKET_SEARCH_PROPERTIES = (
+    "subject", "content", "hs_pipeline", "hs_pipeline_stage", "hs_ticket_status",
+    "status", "hs_ticket_priority", "createdate", "closedate", "hs_lastmodifieddate"
+)
+
+# actorId prefixes of HubSpot agent senders
+AGENT_ACTOR_PREFIXES = ("0-1", "0-2")
+
+# Random extra fraction added to each retry delay so concurrent clients don't retry in lockstep
+RETRY_JITTER = 0.5
+
+# Upper bound on a single retry delay in seconds
+MAX_RETRY_DELAY = 30.0
+
+# Maximum number of concurrent thread message requests
+THREAD_MESSAGES_FETCH_WORKERS = 10
+
+# Reuse ticket association responses for repeated requests
+TICKET_REQUEST_CACHE_TTL = 60
+TICKET_REQUEST_CACHE_SIZE = 1024
+
 class TicketClient:
     """Client for HubSpot ticket-related operations."""
     
-    def __init__(self, hubspot_client: HubSpot, access_token: str):
+    def __init__(
+        self, 
+        hubspot_client: HubSpot, 
+        access_token: str, 
+        session: Optional[requests.Session] = None
+    ):
         """Initialize with HubSpot client instance.
         
         Args:
             hubspot_client: Initialized HubSpot client
             access_token: HubSpot API access token
+            session: Pooled HTTP session for raw API requests (default: a new session)
         """
         self.client = hubspot_client
         self.access_token = access_token
+        self.session = session or create_session()
+        self._headers = {
+            'accept': "application/json",
+            'authorization': f"Bearer {access_token}"
+        }
+        self.rate_limiter = get_rate_limiter(access_token)
+        self._associations_cache = TTLCache(ttl=TICKET_REQUEST_CACHE_TTL, maxsize=TICKET_REQUEST_CACHE_SIZE)
     
     @handle_hubspot_errors
     def get_tickets(
@@ -122,28 +188,7 @@ class TicketClient:
         Returns:
             List of filter groups
         """
-        return [
-            # Primary approach: using the pipeline stage ID
-            {
-                "filters": [
-                    {
-                        "propertyName": "hs_pipeline_stage",
-                        "operator": "EQ",
-                        "value": "4"  # Using the stage ID from the pipeline data
-                    }
-                ]
-            },
-            # Alternative approach: using the properly capitalized stage name
-            {
-                "filters": [
-                    {
-                        "propertyName": "hs_pipeline_stage",
-                        "operator": "EQ",
-                        "value": "Closed"  # Using correct capitalization
-                    }
-                ]
-            }
-        ]
+        return list(CLOSED_CRITERIA_FILTER_GROUPS)
     
     def _create_ticket_search_request(
         self, 
@@ -161,23 +206,9 @@ class TicketClient:
         """
         return PublicObjectSearchRequest(
             filter_groups=filter_groups,
-            sorts=[{
-                "propertyName": "hs_lastmodifieddate",
-                "direction": "DESCENDING"
-            }],
+            sorts=TICKET_SEARCH_SORTS,
             limit=limit,
-            properties=[
-                "subject", 
-                "content", 
-                "hs_pipeline", 
-                "hs_pipeline_stage", 
-                "hs_ticket_status",
-                "status",     
-                "hs_ticket_priority", 
-                "createdate", 
-                "closedate", 
-                "hs_lastmodifieddate"
-            ]
+            properties=TICKET_SEARCH_PROPERTIES
         )
     
     def _execute_ticket_search_with_retry(
@@ -196,61 +227,76 @@ class TicketClient:
         Returns:
             Dictionary with search results and pagination information
         """
-        retry_count = 0
-        current_delay = retry_delay
+        # Log filter groups for debugging (only serialized when DEBUG is enabled)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Executing ticket search with filter groups: {json.dumps(search_request.filter_groups)}")
         
-        while True:
+        for attempt in range(1, max_retries + 2):
             try:
-                # Log filter groups for debugging
-                logger.debug(f"Executing ticket search with filter groups: {json.dumps(search_request.filter_groups)}")
-                
                 # Execute the search
-                search_response = self.client.crm.tickets.search_api.do_search(
-                    public_object_search_request=search_request
-                )
-                
-                # Log raw response
-                logger.debug(f"Search response total results: {search_response.total}")
-                
-                # Convert the response to a dictionary
-                tickets_dict = [ticket.to_dict() for ticket in search_response.results]
-                converted_tickets = convert_datetime_fields(tickets_dict)
-                
-                # Log ticket data if available
-                if tickets_dict:
-                    logger.debug(f"First ticket pipeline stage: {tickets_dict[0].get('properties', {}).get('hs_pipeline_stage')}")
-                    logger.debug(f"First ticket status: {tickets_dict[0].get('properties', {}).get('hs_ticket_status')}")
-                
-                # Get pagination information
-                next_after = None
-                if hasattr(search_response, 'paging') and hasattr(search_response.paging, 'next'):
-                    next_after = search_response.paging.next.after
-                
-                return {
-                    "results": converted_tickets,
-                    "pagination": {
-                        "next": {"after": next_after}
-                    },
-                    "total": search_response.total
-                }
-                
+                with self.rate_limiter:
+                    search_response = self.client.crm.tickets.search_api.do_search(
+                        public_object_search_request=search_request
+                    )
+                break
             except ApiException as e:
-                # Check if it's a rate limiting error (429) or server error (5xx)
-                if e.status == 429 or (e.status >= 500 and e.status < 600):
-                    retry_count += 1
-                    
-                    # Check if we've reached max retries
-                    if retry_count > max_retries:
-                        logger.error(f"Max retries ({max_retries}) exceeded for API request")
-                        raise
-                    
-                    # Calculate exponential backoff delay
-                    sleep_time = current_delay * (2 ** (retry_count - 1))
-                    logger.warning(f"Rate limit hit or server error ({e.status}). Retrying in {sleep_time:.2f} seconds (attempt {retry_count}/{max_retries})")
-                    time.sleep(sleep_time)
-                else:
-                    # Not a rate limiting or server error, re-raise
+                # Only retry rate limiting errors (429) and server errors (5xx)
+                if not (e.status == 429 or 500 <= e.status < 600):
                     raise
+                
+                if attempt > max_retries:
+                    logger.error(f"Max retries ({max_retries}) exceeded for API request")
+                    raise
+                
+                # Calculate exponential backoff delay with jitter, honouring Retry-After
+                sleep_time = retry_delay * (1 << (attempt - 1))
+                sleep_time *= 1 + random.uniform(0, RETRY_JITTER)
+                retry_after = self._get_retry_after(e)
+                if retry_after is not None:
+                    sleep_time = max(sleep_time, retry_after)
+                sleep_time = min(sleep_time, MAX_RETRY_DELAY)
+                logger.warning(f"Rate limit hit or server error ({e.status}). Retrying in {sleep_time:.2f} seconds (attempt {attempt}/{max_retries})")
+                time.sleep(sleep_time)
+        
+        # Log raw response
+        logger.debug(f"Search response total results: {search_response.total}")
+        
+        # Convert each ticket to a dictionary, converting its datetime fields in place
+        converted_tickets = [
+            convert_datetime_fields(ticket.to_dict()) for ticket in search_response.results
+        ]
+        
+        # Log ticket data if available
+        if converted_tickets and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"First ticket pipeline stage: {converted_tickets[0].get('properties', {}).get('hs_pipeline_stage')}")
+            logger.debug(f"First ticket status: {converted_tickets[0].get('properties', {}).get('hs_ticket_status')}")
+        
+        # Get pagination information
+        paging_next = getattr(getattr(search_response, "paging", None), "next", None)
+        next_after = getattr(paging_next, "after", None)
+        
+        return {
+            "results": converted_tickets,
+            "pagination": {
+                "next": {"after": next_after}
+            },
+            "total": search_response.total
+        }
+    
+    def _get_retry_after(self, e: ApiException) -> Optional[float]:
+        """Get the server-requested retry delay from an API exception.
+        
+        Args:
+            e: API exception from a failed request
+            
+        Returns:
+            Retry-After delay in seconds, or None if absent or not numeric
+        """
+        retry_after = (e.headers or {}).get("Retry-After")
+        try:
+            return float(retry_after) if retry_after is not None else None
+        except ValueError:
+            return None
     
     @handle_hubspot_errors
     def get_conversation_threads(self, ticket_id: str) -> Dict[str, Any]:
@@ -293,6 +339,7 @@ class TicketClient:
             logger.error(f"Error retrieving conversation threads for ticket {ticket_id}: {str(e)}", exc_info=True)
             return self._create_empty_ticket_threads_response(ticket_id)
     
+    @ttl_cached("_associations_cache")
     def _get_associated_conversations(self, ticket_id: str) -> Dict[str, Any]:
         """Get conversation threads associated with a ticket.
         
@@ -303,12 +350,8 @@ class TicketClient:
             API response with conversation associations
         """
         url = f"https://api.hubapi.com/crm/v4/objects/tickets/{ticket_id}/associations/conversation"
-        headers = {
-            'accept': "application/json",
-            'authorization': f"Bearer {self.access_token}"
-        }
-        
-        response = requests.get(url, headers=headers)
+        with self.rate_limiter:
+            response = self.session.get(url, headers=self._headers)
         response.raise_for_status()  # Raise exception for HTTP errors
         
         return response.json()
@@ -320,7 +363,7 @@ class TicketClient:
             associated_conversations: Conversations association response
             
         Returns:
-            List of thread IDs
+            List of unique thread IDs, in association order
         """
         thread_ids = []
         
@@ -335,7 +378,8 @@ class TicketClient:
                 # Log warning for debugging
                 logger.warning(f"No 'id' or 'toObjectId' field in conversation: {json.dumps(conversation)}")
         
-        return thread_ids
+        # A thread can be associated more than once (e.g. with several association types)
+        return list(dict.fromkeys(thread_ids))
     
     def _create_empty_ticket_threads_response(self, ticket_id: str) -> Dict[str, Any]:
         """Create an empty ticket threads response.
@@ -356,51 +400,65 @@ class TicketClient:
     def _get_thread_messages(self, thread_ids: List[str]) -> tuple[List[Dict[str, Any]], int]:
         """Get messages for each thread and format them.
         
+        Messages for all threads are fetched concurrently; results keep the
+        order of thread_ids.
+        
         Args:
             thread_ids: List of thread IDs
             
         Returns:
             Tuple of (formatted threads, total message count)
         """
-        threads = []
-        total_messages = 0
+        if not thread_ids:
+            return [], 0
         
-        for thread_id in thread_ids:
-            try:
-                # Get messages for this thread
-                messages_data = self._fetch_thread_messages(thread_id)
-                
-                message_results = messages_data.get("results", [])
-                
-                # Only keep actual messages (not system messages)
-                actual_messages = [msg for msg in message_results if msg.get("type") == "MESSAGE"]
-                
-                # Format thread with its messages
-                formatted_thread = {
-                    "id": thread_id,
-                    "messages": []
-                }
-                
-                # Add formatted messages
-                for msg in actual_messages:
-                    formatted_message = self._format_message(msg)
-                    formatted_thread["messages"].append(formatted_message)
-                
-                # Sort messages by creation time (ascending)
-                formatted_thread["messages"].sort(key=lambda x: x.get("created_at", ""))
-                
-                # Add thread to the list
-                threads.append(formatted_thread)
-                total_messages += len(formatted_thread["messages"])
-                
-            except Exception as e:
-                logger.error(f"Error fetching messages for thread {thread_id}: {str(e)}")
+        with ThreadPoolExecutor(max_workers=min(THREAD_MESSAGES_FETCH_WORKERS, len(thread_ids))) as executor:
+            threads = [
+                thread for thread in executor.map(self._get_formatted_thread, thread_ids)
+                if thread is not None
+            ]
         
+        total_messages = sum(len(thread["messages"]) for thread in threads)
         return threads, total_messages
     
+    def _get_formatted_thread(self, thread_id: str) -> Optional[Dict[str, Any]]:
+        """Fetch a thread's messages and format the thread with them.
+        
+        Args:
+            thread_id: Thread ID
+            
+        Returns:
+            Formatted thread with its messages, or None if the request failed
+        """
+        try:
+            # Get messages for this thread
+            messages_data = self._fetch_thread_messages(thread_id)
+            
+            # Format thread with its actual messages (not system messages)
+            formatted_thread = {
+                "id": thread_id,
+                "messages": [
+                    self._format_message(msg)
+                    for msg in messages_data.get("results", ())
+                    if msg.get("type") == "MESSAGE"
+                ]
+            }
+            
+            # Sort messages by creation time (ascending)
+            formatted_thread["messages"].sort(key=itemgetter("created_at"))
+            
+            return formatted_thread
+            
+        except Exception as e:
+            logger.error(f"Error fetching messages for thread {thread_id}: {str(e)}")
+            return None
+    
     def _fetch_thread_messages(self, thread_id: str) -> Dict[str, Any]:
         """Fetch messages for a specific thread.
         
+        Not cached: only the thread ID is known here, so a cached response
+        would hide new replies until it expired.
+        
         Args:
             thread_id: Thread ID
             
@@ -408,12 +466,8 @@ class TicketClient:
             API response with message results
         """
         messages_url = f"https://api.hubapi.com/conversations/v3/conversations/threads/{thread_id}/messages"
-        headers = {
-            'accept': "application/json",
-            'authorization': f"Bearer {self.access_token}"
-        }
-        
-        response = requests.get(messages_url, headers=headers)
+        with self.rate_limiter:
+            response = self.session.get(messages_url, headers=self._headers)
         response.raise_for_status()
         
         return response.json()
@@ -433,7 +487,7 @@ class TicketClient:
         # Format the message with required metadata
         return {
             "id": msg.get("id"),
-            "created_at": msg.get("createdAt"),
+            "created_at": msg.get("createdAt") or "",
             "sender_type": sender_type,
             "text": msg.get("text", ""),  # Focus only on text content, ignore attachments
         }
@@ -447,12 +501,12 @@ class TicketClient:
         Returns:
             Sender type string
         """
-        sender_type = "UNKNOWN"
-        if msg.get("senders") and len(msg.get("senders")) > 0:
-            sender = msg.get("senders")[0]
-            # In HubSpot, agents typically have senderField as "FROM" and actorId starting with specific prefixes
-            if sender.get("senderField") == "FROM" and sender.get("actorId", "").startswith(("0-1", "0-2")):
-                sender_type = "AGENT"
-            else:
-                sender_type = "CUSTOMER"
-        return sender_type
+        senders = msg.get("senders")
+        if not senders:
+            return "UNKNOWN"
+        
+        sender = senders[0]
+        # In HubSpot, agents typically have senderField as "FROM" and actorId starting with specific prefixes
+        if sender.get("senderField") == "FROM" and (sender.get("actorId") or "").startswith(AGENT_ACTOR_PREFIXES):
+            return "AGENT"
+        return "CUSTOMER"
@@ -0,0 +1,107 @@
+"""
+In-memory caching utilities for HubSpot API responses.
+"""
+import functools
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+_MISSING = object()
+
+class TTLCache:
+    """Thread-safe in-memory cache whose entries expire after a fixed time-to-live."""
+    
+    def __init__(self, ttl: float, maxsize: int = 64):
+        """Initialize the cache.
+        
+        Args:
+            ttl: Time-to-live of each entry in seconds
+            maxsize: Maximum number of entries to keep
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get a cached value if it exists and has not expired.
+        
+        Args:
+            key: Cache key
+            default: Value to return on a cache miss
+        
+        Returns:
+            Cached value or default
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return default
+            
+            return value
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value in the cache.
+        
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        now = time.monotonic()
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= self.maxsize:
+                self._evict(now)
+            self._entries[key] = (now + self.ttl, value)
+    
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._entries.clear()
+    
+    def _evict(self, now: float) -> None:
+        """Drop expired entries, or the oldest entry if none have expired.
+        
+        Args:
+            now: Current monotonic time
+        """
+        expired_keys = [key for key, (expires_at, _) in self._entries.items() if expires_at <= now]
+        for key in expired_keys:
+            del self._entries[key]
+        
+        if not expired_keys and self._entries:
+            del self._entries[next(iter(self._entries))]
+
+def ttl_cached(cache_attribute: str, cache_none: bool = True) -> Callable:
+    """Decorator to cache a client method's results in a TTLCache attribute.
+    
+    Results are keyed on the client's access token and the call arguments, so
+    clients for different HubSpot accounts never share entries. Exceptions are
+    not cached.
+    
+    Args:
+        cache_attribute: Name of the TTLCache attribute on the client instance
+        cache_none: Whether to cache None results; disable for lookups whose
+            negative answer can change at any time (default: True)
+    
+    Returns:
+        Decorator for client methods
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs) -> Any:
+            cache: TTLCache = getattr(self, cache_attribute)
+            key = (hash(self.access_token), args, tuple(sorted(kwargs.items())))
+            
+            value = cache.get(key, _MISSING)
+            if value is _MISSING:
+                value = func(self, *args, **kwargs)
+                if value is not None or cache_none:
+                    cache.set(key, value)
+            return value
+        return wrapper
+    return decorator
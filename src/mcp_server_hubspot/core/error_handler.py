@@ -2,12 +2,13 @@
 Error handling utilities for HubSpot API interactions.
 """
 import logging
-import json
 import functools
 from typing import Any, Callable
 
 from hubspot.crm.contacts.exceptions import ApiException
 
+from .serialization import dumps
+
 logger = logging.getLogger('mcp_hubspot_client.error_handler')
 
 def handle_hubspot_errors(func: Callable) -> Callable:
@@ -25,8 +26,8 @@ def handle_hubspot_errors(func: Callable) -> Callable:
             return func(*args, **kwargs)
         except ApiException as e:
             logger.error(f"API Exception in {func.__name__}: {str(e)}")
-            return json.dumps({"error": str(e)})
+            return dumps({"error": str(e)})
         except Exception as e:
             logger.error(f"Exception in {func.__name__}: {str(e)}")
-            return json.dumps({"error": str(e)})
+            return dumps({"error": str(e)})
     return wrapper
@@ -1,27 +1,122 @@
 """
 Utility module for formatting data.
 """
-from typing import Any
-from datetime import datetime
+import functools
+import time
+from typing import Any, Dict, Sequence
+from datetime import datetime, timedelta, timezone
 from dateutil.tz import tzlocal
 
+# Start of Unix time, used to convert datetimes to epoch milliseconds exactly
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
 def convert_datetime_fields(obj: Any) -> Any:
     """Convert any datetime or tzlocal objects to string in the given object.
     
+    Nested dicts and lists are converted in place, walking the tree with an
+    explicit stack rather than recursion.
+    
     Args:
         obj: Object potentially containing datetime values
         
     Returns:
         Object with datetime fields converted to strings
     """
-    if isinstance(obj, dict):
-        return {k: convert_datetime_fields(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [convert_datetime_fields(item) for item in obj]
-    elif isinstance(obj, datetime):
-        return obj.isoformat()
-    elif isinstance(obj, tzlocal):
-        # Get the current timezone offset
-        offset = datetime.now(tzlocal()).strftime('%z')
-        return f"UTC{offset[:3]}:{offset[3:]}"  # Format like "UTC+08:00" or "UTC-05:00"
+    converted = _convert_datetime_value(obj)
+    if converted is not obj:
+        return converted
+    
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            items = current.items()
+        elif isinstance(current, list):
+            items = enumerate(current)
+        else:
+            continue
+        
+        for key, value in items:
+            converted = _convert_datetime_value(value)
+            if converted is not value:
+                current[key] = converted
+            elif isinstance(value, (dict, list)):
+                stack.append(value)
     return obj
+
+def _convert_datetime_value(value: Any) -> Any:
+    """Convert a single datetime or tzlocal value to string.
+    
+    Args:
+        value: Value to convert
+        
+    Returns:
+        String representation, or the value itself if it needs no conversion
+    """
+    if isinstance(value, datetime):
+        return value.isoformat()
+    elif isinstance(value, tzlocal):
+        return _format_local_utc_offset(int(time.time() // 3600))
+    return value
+
+@functools.lru_cache(maxsize=1)
+def _format_local_utc_offset(hour: int) -> str:
+    """Format the current local timezone offset.
+    
+    Cached per hour, so DST changes are picked up without querying the
+    system timezone for every tzlocal value.
+    
+    Args:
+        hour: Hours since the epoch, used as the cache key
+        
+    Returns:
+        Offset formatted like "UTC+08:00" or "UTC-05:00"
+    """
+    offset = datetime.now(tzlocal()).strftime('%z')
+    return f"UTC{offset[:3]}:{offset[3:]}"
+
+def parse_timestamp_ms(value: str) -> int:
+    """Convert a HubSpot timestamp string to epoch milliseconds.
+    
+    Accepts ISO 8601 strings, with or without fractional seconds and with a
+    "Z" or numeric offset (naive values are treated as UTC), as well as
+    strings that already hold epoch milliseconds.
+    
+    Args:
+        value: Timestamp string
+        
+    Returns:
+        Milliseconds since the Unix epoch
+        
+    Raises:
+        ValueError: If the string is not a recognized timestamp
+    """
+    if value.isdigit():
+        return int(value)
+    
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return (parsed - EPOCH) // timedelta(milliseconds=1)
+
+def project_crm_object(crm_object: Any, properties: Sequence[str]) -> Dict[str, Any]:
+    """Convert an SDK CRM object to a dict with only the given properties.
+    
+    Cheaper than ``to_dict()``, which walks every model attribute, including
+    the history and write-trace fields that search results never populate.
+    
+    Args:
+        crm_object: CRM object from the HubSpot SDK (e.g. a search result)
+        properties: Names of the properties to keep
+        
+    Returns:
+        Dictionary with id, selected properties, timestamps and archived flag
+    """
+    object_properties = crm_object.properties or {}
+    return {
+        "id": crm_object.id,
+        "properties": {name: object_properties.get(name) for name in properties},
+        "created_at": crm_object.created_at,
+        "updated_at": crm_object.updated_at,
+        "archived": crm_object.archived
+    }
@@ -0,0 +1,126 @@
+"""
+HTTP transport utilities for HubSpot API requests.
+"""
+import functools
+import threading
+from typing import Any, Callable, Dict, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from hubspot import HubSpot
+from hubspot.discovery.discovery_base import DiscoveryBase
+from hubspot.utils.requests.http_request_builder import Request
+
+# Compressed response encodings advertised to HubSpot (decoded transparently)
+ACCEPT_ENCODING = "gzip, deflate"
+
+# Connection pool sizing for api.hubapi.com
+POOL_CONNECTIONS = 20
+POOL_MAXSIZE = 50
+
+def _create_retry() -> Retry:
+    """Create the retry policy for transient HubSpot errors.
+    
+    Exhausted retries return the last response instead of raising, so callers
+    still see the HubSpot error status and body.
+    
+    Returns:
+        urllib3 retry policy
+    """
+    return Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=[429, 502, 503, 504],
+        raise_on_status=False
+    )
+
+def create_session() -> requests.Session:
+    """Create a requests session with a pooled, retrying HTTPS adapter.
+    
+    Returns:
+        Configured requests session
+    """
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=_create_retry()
+    )
+    
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.headers.update({"Connection": "keep-alive", "Accept-Encoding": ACCEPT_ENCODING})
+    return session
+
+def send_api_request(
+    session: requests.Session,
+    hubspot_client: HubSpot,
+    options: Dict[str, Any]
+) -> requests.Response:
+    """Send a raw HubSpot API request over a pooled session.
+    
+    Equivalent to ``hubspot_client.api_request(options)``, which opens a new
+    connection for every call, but reuses the session's keep-alive connections.
+    
+    Args:
+        session: Session to send the request with
+        hubspot_client: HubSpot client providing base URL and credentials
+        options: Request options as accepted by ``HubSpot.api_request``
+    
+    Returns:
+        HTTP response
+    """
+    request = Request(hubspot_client.config, options)
+    return session.request(
+        request.get_method(),
+        request.get_url(),
+        **request.get_options_for_sending()
+    )
+
+def _create_cached_api_factory() -> Callable[[Any, str, Dict[str, Any]], Any]:
+    """Create an SDK api_factory that builds each generated API only once.
+    
+    The SDK's default factory creates a new ApiClient, and with it a new
+    urllib3 connection pool, on every attribute access such as
+    ``client.crm.contacts.search_api``. Caching the API objects keeps their
+    pools, and therefore their open connections, alive across calls. Each
+    API also requests compressed responses.
+    
+    Returns:
+        Factory compatible with the HubSpot client's ``api_factory`` option
+    """
+    apis: Dict[Tuple[str, str], Any] = {}
+    lock = threading.Lock()
+    
+    def factory(api_client_package: Any, api_name: str, config: Dict[str, Any]) -> Any:
+        key = (api_client_package.__name__, api_name)
+        with lock:
+            api = apis.get(key)
+            if api is None:
+                api = DiscoveryBase._default_api_factory(api_client_package, api_name, config)
+                # urllib3 sends no Accept-Encoding header by default
+                api.api_client.set_default_header("Accept-Encoding", ACCEPT_ENCODING)
+                apis[key] = api
+            return api
+    
+    return factory
+
+@functools.lru_cache(maxsize=1)
+def get_hubspot_client(access_token: str) -> HubSpot:
+    """Get the process-wide HubSpot SDK client for an access token.
+    
+    The client reuses its generated API objects and their connection pools,
+    and retries transient errors.
+    
+    Args:
+        access_token: HubSpot API access token
+    
+    Returns:
+        Shared HubSpot client
+    """
+    return HubSpot(
+        access_token=access_token,
+        retry=_create_retry(),
+        connection_pool_maxsize=POOL_MAXSIZE,
+        api_factory=_create_cached_api_factory()
+    )
@@ -0,0 +1,76 @@
+"""
+Client-side rate limiting for HubSpot API requests.
+"""
+import logging
+import threading
+import time
+from typing import Dict
+
+logger = logging.getLogger('mcp_hubspot_client.rate_limiter')
+
+# HubSpot's default burst limit for private apps: 100 requests per 10 seconds
+RATE_LIMIT_REQUESTS = 100
+RATE_LIMIT_PERIOD = 10.0
+
+class TokenBucket:
+    """Thread-safe token bucket that paces requests below a rate limit.
+    
+    Can be used as a context manager around each API request.
+    """
+    
+    def __init__(self, rate: int, per: float):
+        """Initialize a full bucket.
+        
+        Args:
+            rate: Number of requests allowed per period
+            per: Period length in seconds
+        """
+        self.capacity = float(rate)
+        self.fill_rate = rate / per
+        self.tokens = float(rate)
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Take one token, blocking until one is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.fill_rate)
+                self.updated_at = now
+                
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                
+                wait_time = (1 - self.tokens) / self.fill_rate
+            
+            logger.debug(f"Rate limit reached, waiting {wait_time:.2f} seconds")
+            time.sleep(wait_time)
+    
+    def __enter__(self) -> "TokenBucket":
+        self.acquire()
+        return self
+    
+    def __exit__(self, *exc_info) -> bool:
+        return False
+
+_buckets: Dict[int, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+def get_rate_limiter(access_token: str) -> TokenBucket:
+    """Get the token bucket shared by all clients using an access token.
+    
+    Args:
+        access_token: HubSpot API access token
+    
+    Returns:
+        Shared token bucket for the token's HubSpot account
+    """
+    key = hash(access_token)
+    with _buckets_lock:
+        bucket = _buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(RATE_LIMIT_REQUESTS, RATE_LIMIT_PERIOD)
+            _buckets[key] = bucket
+        return bucket
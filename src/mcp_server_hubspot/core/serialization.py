@@ -0,0 +1,83 @@
+"""
+JSON serialization helpers, using orjson when it is installed.
+"""
+import json
+from datetime import datetime, timedelta
+from typing import Any, Union
+
+from .formatters import convert_datetime_fields
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+def _default(obj: Any) -> Any:
+    """Serialize values the JSON encoder doesn't support natively.
+    
+    Args:
+        obj: Unsupported value (e.g. tzlocal, or datetime with stdlib json)
+        
+    Returns:
+        JSON-serializable representation of the value
+    """
+    if isinstance(obj, datetime):
+        return _format_datetime(obj)
+    converted = convert_datetime_fields(obj)
+    if converted is not obj:
+        return converted
+    return str(obj)
+
+def _format_datetime(value: datetime) -> str:
+    """Format a datetime the way orjson does with OPT_NAIVE_UTC and OPT_UTC_Z.
+    
+    Keeps the stdlib fallback's output identical to orjson's: naive values are
+    treated as UTC, and a zero UTC offset is written as "Z".
+    
+    Args:
+        value: Datetime to format
+        
+    Returns:
+        ISO 8601 string
+    """
+    if value.tzinfo is None or value.utcoffset() == timedelta(0):
+        return value.replace(tzinfo=None).isoformat() + "Z"
+    return value.isoformat()
+
+def dumps(obj: Any) -> str:
+    """Serialize an object to a JSON string.
+    
+    Uses orjson when available, which serializes datetime values and numpy
+    arrays natively (naive datetimes are treated as UTC). Falls back to the
+    stdlib json module. Other unsupported values, such as tzlocal, are
+    converted by ``convert_datetime_fields`` or stringified, so no separate
+    conversion pass is needed before serializing.
+    
+    Args:
+        obj: Object to serialize
+        
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            obj,
+            default=_default,
+            option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_SERIALIZE_NUMPY
+        ).decode()
+    return json.dumps(obj, default=_default)
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Deserialize a JSON document, e.g. a raw HTTP response body.
+    
+    Uses orjson when available, falling back to the stdlib json module.
+    
+    Args:
+        data: JSON document as text or UTF-8 bytes
+        
+    Returns:
+        Deserialized object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -1,11 +1,14 @@
 """
 Storage handling for HubSpot conversation threads.
 """
-import json
 import logging
+import os
 import pathlib
+import time
 from typing import Any, Dict
 
+from .serialization import dumps, loads
+
 logger = logging.getLogger('mcp_hubspot_client.storage')
 
 class ThreadStorage:
@@ -20,6 +23,7 @@ class ThreadStorage:
         self.storage_dir = storage_dir
         self.storage_dir.mkdir(exist_ok=True)
         self.threads_file = self.storage_dir / "conversation_threads.json"
+        self.cached_at = 0.0
         self.threads_cache = self._load_cache()
     
     def _load_cache(self) -> Dict[str, Any]:
@@ -29,13 +33,17 @@ class ThreadStorage:
             Thread data or empty structure
         """
         try:
-            if self.threads_file.exists():
-                with open(self.threads_file, "r") as f:
-                    return json.load(f)
+            with open(self.threads_file, "rb") as f:
+                cached_at = os.fstat(f.fileno()).st_mtime
+                threads_data = loads(f.read())
+        except FileNotFoundError:
             return {"results": [], "paging": {"next": {"after": None}}}
-        except Exception as e:
+        except (OSError, ValueError) as e:
             logger.error(f"Error loading threads cache: {str(e)}")
             return {"results": [], "paging": {"next": {"after": None}}}
+        
+        self.cached_at = cached_at
+        return threads_data
     
     def save_cache(self, threads_data: Dict[str, Any]) -> None:
         """Save conversation threads to cache file.
@@ -44,8 +52,13 @@ class ThreadStorage:
             threads_data: Thread data to save
         """
         try:
-            with open(self.threads_file, "w") as f:
-                json.dump(threads_data, f, indent=2)
+            # Write to a temporary file and swap it in, so a crash never leaves a truncated cache
+            tmp_file = self.threads_file.with_suffix(".json.tmp")
+            with open(tmp_file, "w") as f:
+                f.write(dumps(threads_data))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.threads_file)
         except Exception as e:
             logger.error(f"Error saving threads cache: {str(e)}")
     
@@ -57,11 +70,38 @@ class ThreadStorage:
         """
         return self.threads_cache
     
+    def is_fresh(self, max_age: float) -> bool:
+        """Check whether the cached threads were fetched recently.
+        
+        Args:
+            max_age: Maximum cache age in seconds
+            
+        Returns:
+            True if the cache is younger than max_age
+        """
+        return time.time() - self.cached_at < max_age
+    
     def update_cache(self, threads_data: Dict[str, Any]) -> None:
         """Update the cache with new thread data.
         
+        Unchanged data (e.g. a page revalidated with a 304) only refreshes the
+        cache timestamp instead of rewriting the file.
+        
         Args:
             threads_data: New thread data
         """
+        if threads_data == self.threads_cache and self.threads_file.exists():
+            self.cached_at = time.time()
+            self._touch_cache_file()
+            return
+        
         self.threads_cache = threads_data
+        self.cached_at = time.time()
         self.save_cache(threads_data)
+    
+    def _touch_cache_file(self) -> None:
+        """Mark the cache file as fresh so its age survives a restart."""
+        try:
+            os.utime(self.threads_file)
+        except Exception as e:
+            logger.error(f"Error touching threads cache: {str(e)}")
@@ -1,36 +1,113 @@
 import os
+import atexit
 import logging
-import glob
-from datetime import datetime, timedelta
+import threading
+import time
+from datetime import date, datetime, timedelta
 import faiss
 import numpy as np
-import json
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Set, Tuple
+
+from .core.serialization import dumps, loads
 
 logger = logging.getLogger("mcp_hubspot_faiss_manager")
 
+# Compressed inverted-file index used once a day's index has enough vectors to train it
+DEFAULT_INDEX_FACTORY = "IVF256,PQ32"
+DEFAULT_NPROBE = 16
+
+# Exhaustive index a day starts with; fp16 halves its memory and scan bandwidth with negligible recall loss
+STAGING_INDEX_FACTORY = "SQfp16"
+
+# Minimum number of vectors needed to train the factory index (k-means wants ~39 points per list)
+MIN_TRAIN_VECTORS = 10000
+TRAIN_VECTORS_PER_LIST = 39
+
+# Vector IDs carry their day's ordinal above this bit, so IDs are unique across days
+ID_DATE_SHIFT = 32
+
+# Unsaved vectors, or seconds since the last save, after which a day's index is written to disk
+DEFAULT_FLUSH_EVERY_N = 1000
+DEFAULT_FLUSH_INTERVAL_S = 60.0
+
 class FaissManager:
     """Manager for FAISS indexes that handles rolling storage by day."""
     
-    def __init__(self, storage_dir: str = "/storage", max_days: int = 7, embedding_dimension: int = 384):
+    def __init__(
+        self, 
+        storage_dir: str = "/storage", 
+        max_days: int = 7, 
+        embedding_dimension: int = 384,
+        index_factory: str = DEFAULT_INDEX_FACTORY,
+        nprobe: int = DEFAULT_NPROBE,
+        flush_every_n: int = DEFAULT_FLUSH_EVERY_N,
+        flush_interval_s: float = DEFAULT_FLUSH_INTERVAL_S
+    ):
         """Initialize the FAISS manager.
         
         Args:
             storage_dir: Directory to store FAISS index files
             max_days: Maximum number of days to keep in storage
             embedding_dimension: Dimension of the embedding vectors (default: 384 for all-MiniLM-L6-v2)
+            index_factory: FAISS factory string for large daily indexes, or "Flat" to
+                always search the exhaustive fp16 index (default: DEFAULT_INDEX_FACTORY)
+            nprobe: Number of inverted lists to visit per search for IVF indexes
+            flush_every_n: Number of unsaved vectors that triggers a save
+            flush_interval_s: Seconds after the last save at which a change triggers a save
         """
         self.storage_dir = storage_dir
         self.max_days = max_days
         self.embedding_dimension = embedding_dimension
+        self.index_factory = index_factory
+        self.nprobe = nprobe
         self.indexes: Dict[str, faiss.Index] = {}
-        self.metadata: Dict[str, List[Dict[str, Any]]] = {}
+        self.metadata: Dict[str, Dict[int, Dict[str, Any]]] = {}
+        self._next_ids: Dict[str, int] = {}
+        
+        # Writes are debounced: changes accumulate in memory until a threshold is hit
+        self.flush_every_n = flush_every_n
+        self.flush_interval_s = flush_interval_s
+        self._dirty: Dict[str, int] = {}
+        self._last_flush: Dict[str, float] = {}
+        
+        # Saves changes left below the thresholds once flush_interval_s has passed, even when idle
+        self._flush_timer: Optional[threading.Timer] = None
+        
+        # IDs whose metadata changed since the last save, appended to the metadata log on save
+        self._unsaved_ids: Dict[str, List[int]] = {}
+        
+        # All day indexes searched in one call, rebuilt whenever an index changes
+        self._shards: Optional[faiss.IndexShards] = None
+        
+        # Search runs on GPU copies of the day indexes when a GPU build of FAISS finds a device
+        self._gpu_resources = (
+            faiss.StandardGpuResources()
+            if hasattr(faiss, "StandardGpuResources") and faiss.get_num_gpus() > 0
+            else None
+        )
+        self._gpu_indexes: Dict[str, faiss.Index] = {}
+        
+        # Past days are memory-mapped read-only and paged in by the OS on demand
+        self._read_only_dates: Set[str] = set()
+        
+        # Past days found on disk but not loaded until they are first needed
+        self._unloaded_dates: List[str] = []
+        
+        # Today's date string, recomputed once the day rolls over
+        self._today_date_str = ""
+        self._today_expires_at = 0.0
+        
+        # Tool calls run on worker threads, so guard index and metadata access
+        self._lock = threading.RLock()
         
         # Ensure storage directory exists
         self._ensure_storage_dir()
         
         # Load existing indexes or create new ones
         self._initialize_indexes()
+        
+        # Persist pending changes on shutdown
+        atexit.register(self.flush)
     
     def _ensure_storage_dir(self) -> None:
         """Create storage directory if it doesn't exist."""
@@ -52,35 +129,87 @@ class FaissManager:
     def _get_metadata_path(self, date_str: str) -> str:
         """Get the path for a specific metadata file.
         
+        Metadata is stored as an append-only NDJSON log with one record per line.
+        
         Args:
             date_str: Date string in YYYY-MM-DD format
             
         Returns:
             Path to the metadata file
         """
+        return os.path.join(self.storage_dir, f"metadata_{date_str}.ndjson")
+    
+    def _get_legacy_metadata_path(self, date_str: str) -> str:
+        """Get the path of a metadata file written as a single JSON document.
+        
+        Args:
+            date_str: Date string in YYYY-MM-DD format
+            
+        Returns:
+            Path to the legacy metadata file
+        """
         return os.path.join(self.storage_dir, f"metadata_{date_str}.json")
     
     def _get_today_date_str(self) -> str:
-        """Get today's date as a string in YYYY-MM-DD format."""
-        return datetime.now().strftime("%Y-%m-%d")
+        """Get today's date as a string in YYYY-MM-DD format.
+        
+        The string is cached until the next local midnight.
+        """
+        if time.time() >= self._today_expires_at:
+            now = datetime.now()
+            next_midnight = now.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
+            self._today_date_str = now.strftime("%Y-%m-%d")
+            self._today_expires_at = next_midnight.timestamp()
+        return self._today_date_str
+    
+    def _get_id_base(self, date_str: str) -> int:
+        """Get the first vector ID of a day.
+        
+        Args:
+            date_str: Date string in YYYY-MM-DD format
+            
+        Returns:
+            Day ordinal shifted into the high bits of a 64-bit ID
+        """
+        return date.fromisoformat(date_str).toordinal() << ID_DATE_SHIFT
+    
+    def _get_id_date_str(self, vector_id: int) -> str:
+        """Get the day a vector ID belongs to.
+        
+        Args:
+            vector_id: Vector ID
+            
+        Returns:
+            Date string in YYYY-MM-DD format
+        """
+        return date.fromordinal(vector_id >> ID_DATE_SHIFT).isoformat()
     
     def _initialize_indexes(self) -> None:
         """Initialize indexes by loading existing ones or creating new ones."""
-        # Get list of existing index files
-        index_files = glob.glob(os.path.join(self.storage_dir, "index_*.faiss"))
+        # Get list of existing index files in a single directory scan
+        with os.scandir(self.storage_dir) as entries:
+            filenames = [entry.name for entry in entries]
+        index_files = [
+            filename for filename in filenames
+            if filename.startswith("index_") and filename.endswith(".faiss")
+        ]
+        
+        # Remove temporary files left behind by a save that was interrupted
+        for filename in filenames:
+            if filename.endswith(".tmp"):
+                logger.warning(f"Removing incomplete file from interrupted save: {filename}")
+                os.remove(os.path.join(self.storage_dir, filename))
         
         if index_files:
             logger.info(f"Found {len(index_files)} existing index files")
             
             # Extract dates from filenames and sort them
             dates = []
-            for file_path in index_files:
-                filename = os.path.basename(file_path)
+            for filename in index_files:
                 # Extract date from filename (format: index_YYYY-MM-DD.faiss)
                 date_str = filename[6:-6]  # Remove "index_" prefix and ".faiss" suffix
                 try:
-                    date = datetime.strptime(date_str, "%Y-%m-%d")
-                    dates.append((date, date_str))
+                    dates.append((date.fromisoformat(date_str), date_str))
                 except ValueError:
                     logger.warning(f"Skipping invalid index filename: {filename}")
             
@@ -91,18 +220,27 @@ class FaissManager:
             recent_dates = dates[:self.max_days]
             
             # Remove older index files
-            for date, date_str in dates[self.max_days:]:
+            for _, date_str in dates[self.max_days:]:
                 self._remove_index(date_str)
             
-            # Load the recent indexes
+            # Load today's index now and past days on first use
+            today = self._get_today_date_str()
             for _, date_str in recent_dates:
-                self._load_index(date_str)
+                if date_str == today:
+                    self._load_index(date_str)
+                else:
+                    self._unloaded_dates.append(date_str)
                 
         # Create today's index if it doesn't exist
         today = self._get_today_date_str()
         if today not in self.indexes:
             self._create_new_index(today)
     
+    def _load_unloaded_indexes(self) -> None:
+        """Load the past days' indexes that were deferred at startup."""
+        while self._unloaded_dates:
+            self._load_index(self._unloaded_dates.pop())
+    
     def _load_index(self, date_str: str) -> None:
         """Load an index and its metadata from disk.
         
@@ -110,44 +248,314 @@ class FaissManager:
             date_str: Date string in YYYY-MM-DD format
         """
         index_path = self._get_index_path(date_str)
-        metadata_path = self._get_metadata_path(date_str)
         
         try:
-            # Load FAISS index
-            index = faiss.read_index(index_path)
+            # Load FAISS index; only today's index is written to
+            read_only = date_str != self._get_today_date_str()
+            index = self._read_index(date_str, read_only)
+            self._configure_index(index)
             
-            # Load metadata
-            if os.path.exists(metadata_path):
-                with open(metadata_path, 'r') as f:
-                    metadata = json.load(f)
-            else:
-                metadata = []
+            # Load metadata, keyed by vector ID
+            has_metadata_log = os.path.exists(self._get_metadata_path(date_str))
+            metadata = self._load_metadata(date_str)
             
             # Store in memory
             self.indexes[date_str] = index
             self.metadata[date_str] = metadata
+            self._invalidate_search_index(date_str)
+            if read_only:
+                self._read_only_dates.add(date_str)
+            
+            if not has_metadata_log or not self._has_dated_ids(date_str):
+                # Migrate an in-memory copy, since mapped files can't be modified
+                self._set_read_only(date_str, False)
+                self._migrate_index(date_str)
+                self._set_read_only(date_str, read_only)
+            self._next_ids[date_str] = max(self.metadata[date_str], default=self._get_id_base(date_str) - 1) + 1
             
             logger.info(f"Loaded index for {date_str} with {index.ntotal} vectors")
         except Exception as e:
             logger.error(f"Failed to load index for {date_str}: {str(e)}")
     
+    def _read_index(self, date_str: str, read_only: bool) -> faiss.Index:
+        """Read a day's index file.
+        
+        Args:
+            date_str: Date string in YYYY-MM-DD format
+            read_only: Whether to memory-map the file instead of reading it into memory
+            
+        Returns:
+            FAISS index
+        """
+        io_flags = faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY if read_only else 0
+        return faiss.read_index(self._get_index_path(date_str), io_flags)
+    
+    def _write_index(self, date_str: str) -> None:
+        """Write a day's index file.
+        
+        The index is written and synced to a temporary file that then replaces
+        the old one, so a crash never leaves a truncated index and
+        memory-mapped readers of the previous file are unaffected.
+        
+        Args:
+            date_str: Date string in YYYY-MM-DD format
+        """
+        index_path = self._get_index_path(date_str)
+        temp_path = f"{index_path}.tmp"
+        faiss.write_index(self.indexes[date_str], temp_path)
+        with open(temp_path, 'rb') as f:
+            os.fsync(f.fileno())
+        os.replace(temp_path, index_path)
+    
+    def _set_read_only(self, date_str: str, read_only: bool) -> None:
+        """Switch a day's index between a memory-mapped and an in-memory copy.
+        
+        A writable index is saved first if it has unsaved changes, and is only
+        mapped once its file is up to date.
+        
+        Args:
+            date_str: Date string in YYYY-MM-DD format
+            read_only: Whether the index should be memory-mapped
+        """
+        if (date_str in self._read_only_dates) == read_only:
+            return
+        
+        if read_only:
+            if self._dirty.get(date_str) or not os.path.exists(self._get_index_path(date_str)):
+                self._save_index(date_str)
+            if self._dirty.get(date_str):
+                return
+            self._read_only_dates.add(date_str)
+        else:
+            self._read_only_dates.discard(date_str)
+        
+        index = self._read_index(date_str, read_only)
+        self._configure_index(index)
+        self.indexes[date_str] = index
+        self._invalidate_search_index(date_str)
+    
+    def _load_metadata(self, date_str: str) -> Dict[int, Dict[str, Any]]:
+        """Load a day's metadata by replaying its NDJSON log.
+        
+        Each line sets the metadata of a vector ID. Metadata saved as a single
+        JSON document by older versions is loaded instead when no log exists.
+        
+        Args:
+            date_str: Date string in YYYY-MM-DD format
+            
+        Returns:
+            Metadata keyed by vector ID
+        """
+        metadata_path = self._get_metadata_path(date_str)
+        legacy_metadata_path = self._get_legacy_metadata_path(date_str)
+        metadata: Dict[int, Dict[str, Any]] = {}
+        
+        if os.path.exists(metadata_path):
+            with open(metadata_path, 'rb') as f:
+                for line in f:
+                    try:
+                        record = loads(line)
+                    except ValueError:
+                        # A crash mid-append can leave a truncated last line
+                        logger.warning(f"Skipping unreadable metadata record for {date_str}")
+                        continue
+                    
+                    metadata[record["id"]] = record["metadata"]
+        elif os.path.exists(legacy_metadata_path):
+            # Older files store a dict keyed by ID, or a list in ID order
+            with open(legacy_metadata_path, 'rb') as f:
+                stored_metadata = loads(f.read())
+            
+            if isinstance(stored_metadata, list):
+                metadata = dict(enumerate(stored_metadata))
+            else:
+                metadata = {int(vector_id): item for vector_id, item in stored_metadata.items()}
+        
+        return metadata
+    
+    def _has_dated_ids(self, date_str: str) -> bool:
+        """Check whether an index and its metadata use IDs based on their day.
+        
+        Args:
+            date_str: Date string in YYYY-MM-DD format
+            
+        Returns:
+            True if no migration is needed
+        """
+        index = self.indexes[date_str]
+        if not isinstance(index, faiss.IndexIDMap2):
+            return False
+        
+        id_base = self._get_id_base(date_str)
+        ids = faiss.vector_to_array(index.id_map)
+        return (
+            (ids.size == 0 or ids.min() >= id_base)
+            and min(self.metadata[date_str], default=id_base) >= id_base
+        )
+    
+    def _migrate_index(self, date_str: str) -> None:
+        """Rewrite an index saved by an older version with IDs based on its day.
+        
+        Older indexes either have no ID map, in which case their IDs are row
+        positions, or start their IDs at 0. Both are moved to the day's ID
+        range, and the index and a fresh metadata log are saved right away.
+        
+        Args:
+            date_str: Date string in YYYY-MM-DD format
+        """
+        index = self.indexes[date_str]
+        id_base = self._get_id_base(date_str)
+        logger.info(f"Migrating index for {date_str} to day-based vector IDs")
+        
+        if isinstance(index, faiss.IndexIDMap2):
+            ids = faiss.vector_to_array(index.id_map)
+            faiss.copy_array_to_vector(np.where(ids < id_base, ids + id_base, ids), index.id_map)
+            index.construct_rev_map()
+        else:
+            # Rebuild an empty copy of the index under an ID map and re-add its vectors
+            inner_index = faiss.clone_index(index)
+            inner_index.reset()
+            ivf_index = faiss.try_extract_index_ivf(index)
+            if ivf_index is not None:
+                ivf_index.make_direct_map()
+            vectors = index.reconstruct_n(0, index.ntotal)
+            
+            id_index = faiss.IndexIDMap2(inner_index)
+            id_index.add_with_ids(vectors, np.arange(id_base, id_base + index.ntotal, dtype=np.int64))
+            self._configure_index(id_index)
+            self.indexes[date_str] = id_index
+            self._invalidate_search_index(date_str)
+        
+        self.metadata[date_str] = {
+            (vector_id + id_base if vector_id < id_base else vector_id): item
+            for vector_id, item in self.metadata[date_str].items()
+        }
+        
+        self._write_index(date_str)
+        self._rewrite_metadata(date_str)
+    
+    def _rewrite_metadata(self, date_str: str) -> None:
+        """Replace a day's metadata log with one record per current item.
+        
+        Args:
+            date_str: Date string in YYYY-MM-DD format
+        """
+        metadata_path = self._get_metadata_path(date_str)
+        temp_path = f"{metadata_path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            for vector_id, item in self.metadata[date_str].items():
+                f.write(dumps({"id": vector_id, "metadata": item}) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, metadata_path)
+        self._unsaved_ids.pop(date_str, None)
+        
+        # The log now holds everything a legacy metadata file did
+        legacy_metadata_path = self._get_legacy_metadata_path(date_str)
+        if os.path.exists(legacy_metadata_path):
+            os.remove(legacy_metadata_path)
+    
+    def _append_metadata(self, date_str: str) -> None:
+        """Append the metadata changed since the last save to a day's NDJSON log.
+        
+        Args:
+            date_str: Date string in YYYY-MM-DD format
+        """
+        unsaved_ids = self._unsaved_ids.get(date_str)
+        if not unsaved_ids:
+            return
+        
+        metadata = self.metadata[date_str]
+        lines = [dumps({"id": vector_id, "metadata": metadata[vector_id]}) for vector_id in unsaved_ids]
+        
+        # A crash mid-append can only truncate the last line, which loading skips
+        with open(self._get_metadata_path(date_str), 'a', encoding='utf-8') as f:
+            f.write("\n".join(lines) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        del self._unsaved_ids[date_str]
+    
     def _create_new_index(self, date_str: str) -> None:
         """Create a new empty index.
         
         Args:
             date_str: Date string in YYYY-MM-DD format
         """
-        # Create a new index using the configured embedding dimension
+        # Create a new index using the configured embedding dimension. It starts
+        # as an exhaustive fp16 index and is replaced by the factory index once
+        # it can be trained.
         dimension = self.embedding_dimension
         logger.debug(f"Creating new index with dimension {dimension}")
-        index = faiss.IndexFlatL2(dimension)
+        index = faiss.IndexIDMap2(faiss.index_factory(dimension, STAGING_INDEX_FACTORY, faiss.METRIC_L2))
         
         # Store in memory
         self.indexes[date_str] = index
-        self.metadata[date_str] = []
+        self.metadata[date_str] = {}
+        self._next_ids[date_str] = self._get_id_base(date_str)
+        self._invalidate_search_index(date_str)
         
         logger.info(f"Created new empty index for {date_str} with dimension {dimension}")
     
+    def _configure_index(self, index: faiss.Index) -> None:
+        """Apply search parameters to an index.
+        
+        Args:
+            index: FAISS index to configure
+        """
+        ivf_index = faiss.try_extract_index_ivf(index)
+        if ivf_index is not None:
+            ivf_index.nprobe = self.nprobe
+    
+    def _is_staging_index(self, index: faiss.Index) -> bool:
+        """Check whether an index is still an untrained exhaustive index.
+        
+        Args:
+            index: FAISS index wrapped by a day's ID map
+            
+        Returns:
+            True for flat and fp16 indexes, which can be replaced by the factory index
+        """
+        if isinstance(index, faiss.IndexFlat):
+            return True
+        return (
+            isinstance(index, faiss.IndexScalarQuantizer)
+            and index.sq.qtype == faiss.ScalarQuantizer.QT_fp16
+        )
+    
+    def _maybe_train_index(self, date_str: str) -> None:
+        """Replace an exhaustive index with the trained factory index once it is large enough.
+        
+        Vector IDs are carried over, so metadata stays valid after the rebuild.
+        
+        Args:
+            date_str: Date string in YYYY-MM-DD format
+        """
+        index = self.indexes[date_str]
+        if (
+            self.index_factory in ("Flat", STAGING_INDEX_FACTORY)
+            or not isinstance(index, faiss.IndexIDMap2)
+            or not self._is_staging_index(faiss.downcast_index(index.index))
+            or index.ntotal < MIN_TRAIN_VECTORS
+        ):
+            return
+        
+        trained_index = faiss.index_factory(self.embedding_dimension, self.index_factory, faiss.METRIC_L2)
+        ivf_index = faiss.try_extract_index_ivf(trained_index)
+        nlist = ivf_index.nlist if ivf_index is not None else 1
+        if index.ntotal < max(MIN_TRAIN_VECTORS, nlist * TRAIN_VECTORS_PER_LIST):
+            return
+        
+        logger.info(f"Training {self.index_factory} index for {date_str} on {index.ntotal} vectors")
+        vectors = index.index.reconstruct_n(0, index.ntotal)
+        ids = faiss.vector_to_array(index.id_map)
+        trained_index.train(vectors)
+        self._configure_index(trained_index)
+        
+        id_index = faiss.IndexIDMap2(trained_index)
+        id_index.add_with_ids(vectors, ids)
+        self.indexes[date_str] = id_index
+        self._invalidate_search_index(date_str)
+    
     def _remove_index(self, date_str: str) -> None:
         """Remove an index and its metadata from disk and memory.
         
@@ -156,13 +564,13 @@ class FaissManager:
         """
         index_path = self._get_index_path(date_str)
         metadata_path = self._get_metadata_path(date_str)
+        legacy_metadata_path = self._get_legacy_metadata_path(date_str)
         
         # Remove files
         try:
-            if os.path.exists(index_path):
-                os.remove(index_path)
-            if os.path.exists(metadata_path):
-                os.remove(metadata_path)
+            for path in (index_path, metadata_path, legacy_metadata_path):
+                if os.path.exists(path):
+                    os.remove(path)
             logger.info(f"Removed old index for {date_str}")
         except Exception as e:
             logger.error(f"Failed to remove index for {date_str}: {str(e)}")
@@ -170,24 +578,83 @@ class FaissManager:
         # Remove from memory
         self.indexes.pop(date_str, None)
         self.metadata.pop(date_str, None)
+        self._next_ids.pop(date_str, None)
+        self._dirty.pop(date_str, None)
+        self._last_flush.pop(date_str, None)
+        self._unsaved_ids.pop(date_str, None)
+        self._read_only_dates.discard(date_str)
+        if date_str in self._unloaded_dates:
+            self._unloaded_dates.remove(date_str)
+        self._invalidate_search_index(date_str)
     
     def save_all_indexes(self) -> None:
-        """Save all indexes and metadata to disk."""
-        for date_str in self.indexes:
+        """Save all indexes and metadata that have unsaved changes to disk."""
+        self.flush()
+    
+    def flush(self, date_str: Optional[str] = None) -> None:
+        """Save indexes that have unsaved changes.
+        
+        Args:
+            date_str: Date string in YYYY-MM-DD format, or None to flush every index
+        """
+        with self._lock:
+            date_strs = [date_str] if date_str is not None else list(self._dirty)
+            for dirty_date_str in date_strs:
+                if self._dirty.get(dirty_date_str):
+                    self._save_index(dirty_date_str)
+    
+    def _mark_dirty(self, date_str: str, count: int) -> None:
+        """Record unsaved changes to an index and save it once a flush threshold is hit.
+        
+        Args:
+            date_str: Date string in YYYY-MM-DD format
+            count: Number of vectors added
+        """
+        self._dirty[date_str] = self._dirty.get(date_str, 0) + count
+        last_flush = self._last_flush.setdefault(date_str, time.monotonic())
+        
+        if (
+            self._dirty[date_str] >= self.flush_every_n
+            or time.monotonic() - last_flush > self.flush_interval_s
+        ):
             self._save_index(date_str)
+        else:
+            self._schedule_flush()
+    
+    def _schedule_flush(self) -> None:
+        """Start the flush timer unless it is already running.
+        
+        Without it, changes below flush_every_n would stay in memory until the
+        next add_data call or shutdown, however long the server sits idle.
+        """
+        if self._flush_timer is not None:
+            return
+        
+        self._flush_timer = threading.Timer(self.flush_interval_s, self._flush_on_timer)
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
+    
+    def _flush_on_timer(self) -> None:
+        """Save every index with unsaved changes when the flush timer fires."""
+        with self._lock:
+            self._flush_timer = None
+            self.flush()
     
     def save_today_index(self) -> None:
-        """Save only today's index and metadata to disk."""
-        today = self._get_today_date_str()
-        logger.debug(f"Attempting to save today's index ({today})")
-        if today in self.indexes:
-            index_size = self.indexes[today].ntotal
-            metadata_count = len(self.metadata[today])
-            logger.debug(f"Today's index contains {index_size} vectors and {metadata_count} metadata items")
-            self._save_index(today)
-            logger.info(f"Saved today's index ({today}) with {index_size} vectors")
-        else:
-            logger.warning(f"Today's index ({today}) does not exist")
+        """Save only today's index and metadata to disk, if they have unsaved changes."""
+        with self._lock:
+            today = self._get_today_date_str()
+            logger.debug(f"Attempting to save today's index ({today})")
+            if today in self.indexes and not self._dirty.get(today):
+                logger.debug(f"Today's index ({today}) has no unsaved changes")
+            elif today in self.indexes:
+                index_size = self.indexes[today].ntotal
+                metadata_count = len(self.metadata[today])
+                logger.debug(f"Today's index contains {index_size} vectors and {metadata_count} metadata items")
+                self._save_index(today)
+                logger.info(f"Saved today's index ({today}) with {index_size} vectors")
+            else:
+                logger.warning(f"Today's index ({today}) does not exist")
     
     def _save_index(self, date_str: str) -> None:
         """Save an index and its metadata to disk.
@@ -198,6 +665,10 @@ class FaissManager:
         if date_str not in self.indexes:
             logger.warning(f"Cannot save non-existent index for {date_str}")
             return
+        if date_str in self._read_only_dates:
+            # The index is mapped from its own file, which must not be rewritten
+            logger.warning(f"Cannot save read-only index for {date_str}")
+            return
         
         index_path = self._get_index_path(date_str)
         metadata_path = self._get_metadata_path(date_str)
@@ -205,15 +676,16 @@ class FaissManager:
         try:
             logger.debug(f"Saving FAISS index for {date_str} to {index_path}")
             # Save FAISS index
-            faiss.write_index(self.indexes[date_str], index_path)
+            self._write_index(date_str)
             logger.debug(f"FAISS index saved successfully")
             
-            logger.debug(f"Saving metadata for {date_str} to {metadata_path} ({len(self.metadata[date_str])} items)")
-            # Save metadata
-            with open(metadata_path, 'w') as f:
-                json.dump(self.metadata[date_str], f)
+            logger.debug(f"Appending metadata for {date_str} to {metadata_path} ({len(self._unsaved_ids.get(date_str, []))} changed items)")
+            # Save metadata changes only, keeping each save proportional to the batch
+            self._append_metadata(date_str)
             logger.debug(f"Metadata saved successfully")
             
+            self._dirty.pop(date_str, None)
+            self._last_flush[date_str] = time.monotonic()
             logger.info(f"Saved index for {date_str} with {self.indexes[date_str].ntotal} vectors")
         except Exception as e:
             logger.error(f"Failed to save index for {date_str}: {str(e)}", exc_info=True)
@@ -225,31 +697,91 @@ class FaissManager:
             vectors: NumPy array of vectors to add
             metadata_list: List of metadata dictionaries
         """
-        today = self._get_today_date_str()
-        logger.debug(f"Adding data to index for {today}")
-        logger.debug(f"Vector data shape: {vectors.shape}, metadata list length: {len(metadata_list)}")
+        with self._lock:
+            today = self._get_today_date_str()
+            logger.debug(f"Adding data to index for {today}")
+            logger.debug(f"Vector data shape: {vectors.shape}, metadata list length: {len(metadata_list)}")
+            
+            # Create today's index if it doesn't exist
+            if today not in self.indexes:
+                logger.debug(f"Today's index ({today}) does not exist, creating new index")
+                # Past days are no longer written to, so map them from disk
+                for date_str in list(self.indexes):
+                    self._set_read_only(date_str, True)
+                self._create_new_index(today)
+            
+            # FAISS copies any input that isn't C-contiguous float32
+            vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+            
+            # Add vectors to the index under new IDs
+            logger.debug(f"Current index size before addition: {self.indexes[today].ntotal}")
+            first_id = self._next_ids[today]
+            ids = np.arange(first_id, first_id + len(vectors), dtype=np.int64)
+            self._next_ids[today] = first_id + len(vectors)
+            self.indexes[today].add_with_ids(vectors, ids)
+            self._maybe_train_index(today)
+            self._invalidate_search_index(today)
+            logger.debug(f"Current index size after addition: {self.indexes[today].ntotal}")
+            
+            # Add metadata
+            current_metadata_count = len(self.metadata[today])
+            logger.debug(f"Current metadata count before addition: {current_metadata_count}")
+            new_ids = ids.tolist()
+            self.metadata[today].update(zip(new_ids, metadata_list))
+            self._unsaved_ids.setdefault(today, []).extend(new_ids)
+            logger.debug(f"Current metadata count after addition: {len(self.metadata[today])}")
+            
+            # Save the updated index once enough changes have accumulated
+            self._mark_dirty(today, len(vectors))
+            
+            logger.info(f"Added {len(vectors)} vectors to index for {today}, new total: {self.indexes[today].ntotal}")
+    
+    def _invalidate_search_index(self, date_str: str) -> None:
+        """Drop search structures built from a day's index after it changes.
         
-        # Create today's index if it doesn't exist
-        if today not in self.indexes:
-            logger.debug(f"Today's index ({today}) does not exist, creating new index")
-            self._create_new_index(today)
+        Args:
+            date_str: Date string in YYYY-MM-DD format
+        """
+        self._gpu_indexes.pop(date_str, None)
+        self._shards = None
+    
+    def _get_search_index(self, date_str: str) -> faiss.Index:
+        """Get the index to search for a day, copied to the GPU when one is available.
         
-        # Add vectors to the index
-        logger.debug(f"Current index size before addition: {self.indexes[today].ntotal}")
-        self.indexes[today].add(vectors)
-        logger.debug(f"Current index size after addition: {self.indexes[today].ntotal}")
+        The CPU index stays the copy that is written to and saved.
         
-        # Add metadata
-        current_metadata_count = len(self.metadata[today])
-        logger.debug(f"Current metadata count before addition: {current_metadata_count}")
-        self.metadata[today].extend(metadata_list)
-        logger.debug(f"Current metadata count after addition: {len(self.metadata[today])}")
+        Args:
+            date_str: Date string in YYYY-MM-DD format
+            
+        Returns:
+            GPU copy of the day's index, or the index itself
+        """
+        index = self.indexes[date_str]
+        if self._gpu_resources is None:
+            return index
         
-        logger.debug(f"Saving index after data addition")
-        # Save the updated index
-        self._save_index(today)
+        gpu_index = self._gpu_indexes.get(date_str)
+        if gpu_index is None:
+            try:
+                gpu_index = faiss.index_cpu_to_gpu(self._gpu_resources, 0, index)
+            except RuntimeError as e:
+                logger.debug(f"Searching index for {date_str} on CPU: {str(e)}")
+                gpu_index = index
+            self._gpu_indexes[date_str] = gpu_index
+        return gpu_index
+    
+    def _get_shards(self) -> faiss.IndexShards:
+        """Get an index that searches every day's index in a single call.
         
-        logger.info(f"Added {len(vectors)} vectors to index for {today}, new total: {self.indexes[today].ntotal}")
+        Returns:
+            Shards over all day indexes, returning their vector IDs unchanged
+        """
+        if self._shards is None:
+            shards = faiss.IndexShards(self.embedding_dimension, True, False)
+            for date_str in self.indexes:
+                shards.add_shard(self._get_search_index(date_str))
+            self._shards = shards
+        return self._shards
     
     def search(self, query_vector: np.ndarray, k: int = 10) -> Tuple[List[Dict[str, Any]], List[float]]:
         """Search across all indexes for the most similar vectors.
@@ -261,37 +793,28 @@ class FaissManager:
         Returns:
             Tuple of (metadata_list, distances)
         """
-        all_results = []
-        
-        # Ensure query_vector is properly shaped (1 x dim)
-        if len(query_vector.shape) == 1:
-            query_vector = query_vector.reshape(1, -1)
-        
-        for date_str, index in self.indexes.items():
-            if index.ntotal == 0:
-                continue
+        with self._lock:
+            self._load_unloaded_indexes()
+            shards = self._get_shards()
+            if shards.ntotal == 0:
+                return [], []
+            
+            # Ensure query_vector is a C-contiguous float32 row (1 x dim), as FAISS expects
+            query_vector = np.ascontiguousarray(query_vector, dtype=np.float32).reshape(1, -1)
+            
+            # FAISS searches the days in parallel and merges their top-k results
+            distances, indices = shards.search(query_vector, min(k, shards.ntotal))
+            
+            metadata_list = []
+            result_distances = []
+            for distance, vector_id in zip(distances[0].tolist(), indices[0].tolist()):
+                if vector_id == -1:  # -1 indicates no match found
+                    continue
                 
-            # Search in this index
-            distances, indices = index.search(query_vector, min(k, index.ntotal))
-            
-            # Get metadata for results
-            for i, idx in enumerate(indices[0]):
-                if idx != -1:  # -1 indicates no match found
-                    result = {
-                        "metadata": self.metadata[date_str][idx],
-                        "distance": float(distances[0][i]),
-                        "date": date_str
-                    }
-                    all_results.append(result)
-        
-        # Sort by distance (ascending)
-        all_results.sort(key=lambda x: x["distance"])
-        
-        # Return top k results
-        top_results = all_results[:k]
-        
-        # Separate metadata and distances
-        metadata_list = [result["metadata"] for result in top_results]
-        distances = [result["distance"] for result in top_results]
-        
-        return metadata_list, distances 
\ No newline at end of file
+                # Vector IDs encode the day whose metadata they belong to
+                metadata = self.metadata.get(self._get_id_date_str(vector_id), {}).get(vector_id)
+                if metadata is not None:
+                    metadata_list.append(metadata)
+                    result_distances.append(distance)
+            
+            return metadata_list, result_distances 
\ No newline at end of file
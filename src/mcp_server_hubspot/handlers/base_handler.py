@@ -2,13 +2,13 @@
 Base handler for HubSpot API operations.
 Provides common functionality for all specialized handlers.
 """
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 import logging
-import json
 
 import mcp.types as types
 from sentence_transformers import SentenceTransformer
 
+from ..core.serialization import dumps
 from ..hubspot_client import HubSpotClient
 from ..faiss_manager import FaissManager
 from ..utils import store_in_faiss
@@ -40,14 +40,18 @@ class BaseHandler:
         self, 
         data: Any, 
         data_type: str, 
-        metadata_extras: Optional[Dict[str, Any]] = None
+        metadata_extras: Optional[Dict[str, Any]] = None,
+        item_metadata_extras: Optional[List[Dict[str, Any]]] = None
     ) -> None:
         """Safely store data in FAISS with error handling.
         
+        Pass every item in one call so they are embedded and added as a batch.
+        
         Args:
             data: Data to store
             data_type: Type of data being stored
             metadata_extras: Additional metadata to store
+            item_metadata_extras: Additional metadata for each item, in the same order as data
         """
         try:
             if not data:
@@ -59,19 +63,16 @@ class BaseHandler:
             if metadata_extras:
                 self.logger.debug(f"With metadata: {metadata_extras}")
                 
+            # The FAISS manager saves the index to disk once enough changes accumulate
             store_in_faiss(
                 faiss_manager=self.faiss_manager,
                 data=data,
                 data_type=data_type,
                 model=self.embedding_model,
-                metadata_extras=metadata_extras
+                metadata_extras=metadata_extras,
+                item_metadata_extras=item_metadata_extras
             )
             
-            # Save the index
-            self.logger.debug("Saving FAISS index")
-            self.faiss_manager.save_today_index()
-            self.logger.debug("FAISS index saved")
-            
         except Exception as e:
             self.logger.error(f"Error storing {data_type} in FAISS: {str(e)}", exc_info=True)
     
@@ -85,26 +86,30 @@ class BaseHandler:
             List containing a TextContent object
         """
         if not isinstance(content, str):
-            content = json.dumps(content)
+            content = dumps(content)
             
         return [types.TextContent(type="text", text=content)]
     
-    def validate_required_arguments(self, arguments: Optional[Dict[str, Any]], required_keys: List[str]) -> None:
+    def validate_required_arguments(self, arguments: Optional[Dict[str, Any]], required_keys: Sequence[str]) -> None:
         """Validate that required arguments are present.
         
         Args:
             arguments: Dictionary of arguments
-            required_keys: List of required keys
+            required_keys: Required keys
             
         Raises:
-            ValueError: If any required key is missing
+            ValueError: If any required key is missing, listing every missing key
         """
         if not arguments:
             raise ValueError(f"Missing arguments. Required: {', '.join(required_keys)}")
+        if all(key in arguments for key in required_keys):
+            return
             
-        for key in required_keys:
-            if key not in arguments:
-                raise ValueError(f"Missing required argument: {key}")
+        missing_keys = [key for key in required_keys if key not in arguments]
+        if len(missing_keys) == 1:
+            raise ValueError(f"Missing required argument: {missing_keys[0]}")
+        if missing_keys:
+            raise ValueError(f"Missing required arguments: {', '.join(missing_keys)}")
                 
     def get_argument_with_default(
         self, 
@@ -126,3 +131,41 @@ class BaseHandler:
             return default
             
         return arguments.get(key, default)
+    
+    def get_int_argument(
+        self, 
+        arguments: Optional[Dict[str, Any]], 
+        key: str, 
+        default: int
+    ) -> int:
+        """Get an argument as an integer, with a default if missing or null.
+        
+        Args:
+            arguments: Dictionary of arguments
+            key: Argument key
+            default: Default value
+            
+        Returns:
+            Argument value converted to int, or default
+        """
+        value = arguments.get(key) if arguments else None
+        return default if value is None else int(value)
+    
+    def get_float_argument(
+        self, 
+        arguments: Optional[Dict[str, Any]], 
+        key: str, 
+        default: float
+    ) -> float:
+        """Get an argument as a float, with a default if missing or null.
+        
+        Args:
+            arguments: Dictionary of arguments
+            key: Argument key
+            default: Default value
+            
+        Returns:
+            Argument value converted to float, or default
+        """
+        value = arguments.get(key) if arguments else None
+        return default if value is None else float(value)
@@ -2,14 +2,42 @@
 Handler for company-related HubSpot operations.
 """
 from typing import Any, Dict, List, Optional
-import json
 
 import mcp.types as types
+from hubspot.crm.companies import PublicObjectSearchRequest, SimplePublicObjectInputForCreate
 
+from ..core.serialization import dumps
 from ..hubspot_client import HubSpotClient, ApiException
 from ..faiss_manager import FaissManager
 from .base_handler import BaseHandler
 
+# Input schema for creating a company
+CREATE_COMPANY_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string", "description": "Company name"},
+        "properties": {"type": "object", "description": "Additional company properties"}
+    },
+    "required": ["name"]
+}
+
+# Input schema for company activity
+COMPANY_ACTIVITY_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "company_id": {"type": "string", "description": "HubSpot company ID"}
+    },
+    "required": ["company_id"]
+}
+
+# Input schema for active companies
+ACTIVE_COMPANIES_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "limit": {"type": "integer", "description": "Maximum number of companies to return (default: 10)"}
+    }
+}
+
 class CompanyHandler(BaseHandler):
     """Handler for company-related HubSpot tools."""
     
@@ -29,14 +57,7 @@ class CompanyHandler(BaseHandler):
         Returns:
             Schema definition dictionary
         """
-        return {
-            "type": "object",
-            "properties": {
-                "name": {"type": "string", "description": "Company name"},
-                "properties": {"type": "object", "description": "Additional company properties"}
-            },
-            "required": ["name"]
-        }
+        return CREATE_COMPANY_SCHEMA
     
     def get_company_activity_schema(self) -> Dict[str, Any]:
         """Get the input schema for company activity.
@@ -44,13 +65,7 @@ class CompanyHandler(BaseHandler):
         Returns:
             Schema definition dictionary
         """
-        return {
-            "type": "object",
-            "properties": {
-                "company_id": {"type": "string", "description": "HubSpot company ID"}
-            },
-            "required": ["company_id"]
-        }
+        return COMPANY_ACTIVITY_SCHEMA
     
     def get_active_companies_schema(self) -> Dict[str, Any]:
         """Get the input schema for active companies.
@@ -58,12 +73,7 @@ class CompanyHandler(BaseHandler):
         Returns:
             Schema definition dictionary
         """
-        return {
-            "type": "object",
-            "properties": {
-                "limit": {"type": "integer", "description": "Maximum number of companies to return (default: 10)"}
-            }
-        }
+        return ACTIVE_COMPANIES_SCHEMA
     
     def create_company(self, arguments: Optional[Dict[str, Any]]) -> List[types.TextContent]:
         """Create a new company in HubSpot.
@@ -74,11 +84,9 @@ class CompanyHandler(BaseHandler):
         Returns:
             Text response with result
         """
-        self.validate_required_arguments(arguments, ["name"])
+        self.validate_required_arguments(arguments, ("name",))
         
         try:
-            from hubspot.crm.companies import PublicObjectSearchRequest
-            
             company_name = arguments["name"]
             
             # Search for existing companies with same name
@@ -101,7 +109,7 @@ class CompanyHandler(BaseHandler):
             if search_response.total > 0:
                 # Company already exists
                 return self.create_text_response(
-                    f"Company already exists: {search_response.results[0].to_dict()}"
+                    "Company already exists: " + dumps(search_response.results[0].to_dict())
                 )
             
             # If no existing company found, proceed with creation
@@ -114,8 +122,6 @@ class CompanyHandler(BaseHandler):
                 properties.update(arguments["properties"])
             
             # Create company using SimplePublicObjectInputForCreate
-            from hubspot.crm.companies import SimplePublicObjectInputForCreate
-            
             simple_public_object_input = SimplePublicObjectInputForCreate(
                 properties=properties
             )
@@ -123,7 +129,8 @@ class CompanyHandler(BaseHandler):
             api_response = self.hubspot.client.crm.companies.basic_api.create(
                 simple_public_object_input_for_create=simple_public_object_input
             )
-            return self.create_text_response(str(api_response.to_dict()))
+            self.hubspot.companies.invalidate_recent()
+            return self.create_text_response(api_response.to_dict())
                 
         except ApiException as e:
             return self.create_text_response(f"HubSpot API error: {str(e)}")
@@ -139,19 +146,19 @@ class CompanyHandler(BaseHandler):
         Returns:
             Text response with company activity data
         """
-        self.validate_required_arguments(arguments, ["company_id"])
+        self.validate_required_arguments(arguments, ("company_id",))
         
-        results = self.hubspot.get_company_activity(arguments["company_id"])
-        
-        # Store in FAISS for future reference
         try:
-            data = json.loads(results)
-            metadata_extras = {"company_id": arguments["company_id"]}
-            self.store_in_faiss_safely(data, "company_activity", metadata_extras)
+            data = self.hubspot.get_company_activity_data(arguments["company_id"])
         except Exception as e:
-            self.logger.error(f"Error parsing company activity data: {str(e)}")
+            self.logger.error(f"Error getting company activity: {str(e)}")
+            return self.create_text_response({"error": str(e)})
         
-        return self.create_text_response(results)
+        # Store in FAISS for future reference
+        metadata_extras = {"company_id": arguments["company_id"]}
+        self.store_in_faiss_safely(data, "company_activity", metadata_extras)
+        
+        return self.create_text_response(data)
     
     def get_active_companies(self, arguments: Optional[Dict[str, Any]]) -> List[types.TextContent]:
         """Get most recently active companies from HubSpot.
@@ -162,19 +169,16 @@ class CompanyHandler(BaseHandler):
         Returns:
             Text response with company data
         """
-        limit = self.get_argument_with_default(arguments, "limit", 10)
-        
-        # Ensure limit is an integer
-        limit = int(limit) if limit is not None else 10
-        
-        results = self.hubspot.get_recent_companies(limit=limit)
+        limit = self.get_int_argument(arguments, "limit", 10)
         
-        # Store in FAISS for future reference
         try:
-            data = json.loads(results)
-            metadata_extras = {"limit": limit}
-            self.store_in_faiss_safely(data, "company", metadata_extras)
+            data = self.hubspot.get_recent_companies_data(limit=limit)
         except Exception as e:
-            self.logger.error(f"Error parsing company data: {str(e)}")
+            self.logger.error(f"Error getting recent companies: {str(e)}")
+            return self.create_text_response({"error": str(e)})
+        
+        # Store in FAISS for future reference
+        metadata_extras = {"limit": limit}
+        self.store_in_faiss_safely(data, "company", metadata_extras)
         
-        return self.create_text_response(results)
+        return self.create_text_response(data)
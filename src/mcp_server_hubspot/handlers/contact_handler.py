@@ -2,13 +2,46 @@
 Handler for contact-related HubSpot operations.
 """
 from typing import Any, Dict, List, Optional
-import json
 
 import mcp.types as types
 
+from ..core.serialization import dumps
 from ..hubspot_client import ApiException
 from .base_handler import BaseHandler
 
+# Input schema for creating a contact
+CREATE_CONTACT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "firstname": {"type": "string", "description": "Contact's first name"},
+        "lastname": {"type": "string", "description": "Contact's last name"},
+        "email": {"type": "string", "description": "Contact's email address"},
+        "properties": {"type": "object", "description": "Additional contact properties"}
+    },
+    "required": ["firstname", "lastname"]
+}
+
+# Input schema for creating several contacts at once
+CREATE_CONTACTS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "contacts": {
+            "type": "array",
+            "description": "Contacts to create, each with the same fields as hubspot_create_contact",
+            "items": CREATE_CONTACT_SCHEMA
+        }
+    },
+    "required": ["contacts"]
+}
+
+# Input schema for active contacts
+ACTIVE_CONTACTS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "limit": {"type": "integer", "description": "Maximum number of contacts to return (default: 10)"}
+    }
+}
+
 class ContactHandler(BaseHandler):
     """Handler for contact-related HubSpot tools."""
     
@@ -28,16 +61,15 @@ class ContactHandler(BaseHandler):
         Returns:
             Schema definition dictionary
         """
-        return {
-            "type": "object",
-            "properties": {
-                "firstname": {"type": "string", "description": "Contact's first name"},
-                "lastname": {"type": "string", "description": "Contact's last name"},
-                "email": {"type": "string", "description": "Contact's email address"},
-                "properties": {"type": "object", "description": "Additional contact properties"}
-            },
-            "required": ["firstname", "lastname"]
-        }
+        return CREATE_CONTACT_SCHEMA
+    
+    def get_create_contacts_schema(self) -> Dict[str, Any]:
+        """Get the input schema for creating several contacts.
+        
+        Returns:
+            Schema definition dictionary
+        """
+        return CREATE_CONTACTS_SCHEMA
     
     def get_active_contacts_schema(self) -> Dict[str, Any]:
         """Get the input schema for active contacts.
@@ -45,12 +77,7 @@ class ContactHandler(BaseHandler):
         Returns:
             Schema definition dictionary
         """
-        return {
-            "type": "object",
-            "properties": {
-                "limit": {"type": "integer", "description": "Maximum number of contacts to return (default: 10)"}
-            }
-        }
+        return ACTIVE_CONTACTS_SCHEMA
     
     def create_contact(self, arguments: Optional[Dict[str, Any]]) -> List[types.TextContent]:
         """Create a new contact in HubSpot.
@@ -61,83 +88,70 @@ class ContactHandler(BaseHandler):
         Returns:
             Text response with result
         """
-        self.validate_required_arguments(arguments, ["firstname", "lastname"])
+        properties = self._get_contact_properties(arguments)
         
         try:
-            from hubspot.crm.contacts import PublicObjectSearchRequest
-            
-            firstname = arguments["firstname"]
-            lastname = arguments["lastname"]
-            company = arguments.get("properties", {}).get("company")
-            
-            # Search for existing contacts with same name and company
-            filter_groups = [{
-                "filters": [
-                    {
-                        "propertyName": "firstname",
-                        "operator": "EQ",
-                        "value": firstname
-                    },
-                    {
-                        "propertyName": "lastname",
-                        "operator": "EQ",
-                        "value": lastname
-                    }
-                ]
-            }]
-            
-            # Add company filter if provided
-            if company:
-                filter_groups[0]["filters"].append({
-                    "propertyName": "company",
-                    "operator": "EQ",
-                    "value": company
-                })
-            
-            search_request = PublicObjectSearchRequest(
-                filter_groups=filter_groups
-            )
-            
-            search_response = self.hubspot.client.crm.contacts.search_api.do_search(
-                public_object_search_request=search_request
-            )
-            
-            if search_response.total > 0:
-                # Contact already exists
-                return self.create_text_response(
-                    f"Contact already exists: {search_response.results[0].to_dict()}"
-                )
-            
-            # If no existing contact found, proceed with creation
-            properties = {
-                "firstname": firstname,
-                "lastname": lastname
-            }
-            
-            # Add email if provided
-            if "email" in arguments:
-                properties["email"] = arguments["email"]
-            
-            # Add any additional properties
-            if "properties" in arguments:
-                properties.update(arguments["properties"])
-            
-            # Create contact using SimplePublicObjectInputForCreate
-            from hubspot.crm.contacts import SimplePublicObjectInputForCreate
-            
-            simple_public_object_input = SimplePublicObjectInputForCreate(
-                properties=properties
-            )
+            # Skips creation when a contact with the same name and company exists
+            result = self.hubspot.contacts.create_contact(properties)
+        except ApiException as e:
+            return self.create_text_response(f"HubSpot API error: {str(e)}")
+        except Exception as e:
+            return self.create_text_response(f"Error: {str(e)}")
+        
+        if result.get("already_exists"):
+            return self.create_text_response("Contact already exists: " + dumps(result["contact"]))
+        return self.create_text_response(result)
+    
+    def create_contacts(self, arguments: Optional[Dict[str, Any]]) -> List[types.TextContent]:
+        """Create several contacts in HubSpot in batches.
+        
+        Args:
+            arguments: Tool arguments containing the list of contacts
             
-            api_response = self.hubspot.client.crm.contacts.basic_api.create(
-                simple_public_object_input_for_create=simple_public_object_input
-            )
-            return self.create_text_response(str(api_response.to_dict()))
-                
+        Returns:
+            Text response with the created contacts, the existing contacts that
+            were skipped, and the errors of contacts that could not be created
+        """
+        self.validate_required_arguments(arguments, ("contacts",))
+        contacts = [self._get_contact_properties(contact) for contact in arguments["contacts"]]
+        
+        try:
+            result = self.hubspot.create_contacts(contacts)
         except ApiException as e:
             return self.create_text_response(f"HubSpot API error: {str(e)}")
         except Exception as e:
             return self.create_text_response(f"Error: {str(e)}")
+        
+        return self.create_text_response(result)
+    
+    def _get_contact_properties(self, arguments: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build HubSpot contact properties from create-contact arguments.
+        
+        Args:
+            arguments: Contact fields (firstname, lastname, email, properties)
+            
+        Returns:
+            Contact properties
+            
+        Raises:
+            ValueError: If firstname or lastname is missing
+        """
+        self.validate_required_arguments(arguments, ("firstname", "lastname"))
+        
+        properties = {
+            "firstname": arguments["firstname"],
+            "lastname": arguments["lastname"]
+        }
+        
+        # Add email if provided
+        if "email" in arguments:
+            properties["email"] = arguments["email"]
+        
+        # Add any additional properties
+        if "properties" in arguments:
+            properties.update(arguments["properties"])
+        
+        return properties
     
     def get_active_contacts(self, arguments: Optional[Dict[str, Any]]) -> List[types.TextContent]:
         """Get most recently active contacts from HubSpot.
@@ -148,19 +162,16 @@ class ContactHandler(BaseHandler):
         Returns:
             Text response with contact data
         """
-        limit = self.get_argument_with_default(arguments, "limit", 10)
-        
-        # Ensure limit is an integer
-        limit = int(limit) if limit is not None else 10
-        
-        results = self.hubspot.get_recent_contacts(limit=limit)
+        limit = self.get_int_argument(arguments, "limit", 10)
         
-        # Store in FAISS for future reference
         try:
-            data = json.loads(results)
-            metadata_extras = {"limit": limit}
-            self.store_in_faiss_safely(data, "contact", metadata_extras)
+            data = self.hubspot.get_recent_contacts_data(limit=limit)
         except Exception as e:
-            self.logger.error(f"Error parsing contact data: {str(e)}")
+            self.logger.error(f"Error getting recent contacts: {str(e)}")
+            return self.create_text_response({"error": str(e)})
+        
+        # Store in FAISS for future reference
+        metadata_extras = {"limit": limit}
+        self.store_in_faiss_safely(data, "contact", metadata_extras)
         
-        return self.create_text_response(results)
+        return self.create_text_response(data)
@@ -8,6 +8,19 @@ import mcp.types as types
 
 from .base_handler import BaseHandler
 
+# Characters of message text kept in conversation responses
+MESSAGE_PREVIEW_LENGTH = 200
+
+# Input schema for recent conversations
+RECENT_CONVERSATIONS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "limit": {"type": "integer", "description": "Maximum number of threads to return (default: 10)"},
+        "after": {"type": "string", "description": "Pagination token"},
+        "refresh_cache": {"type": "boolean", "description": "Whether to refresh the threads cache (default: false)"}
+    },
+}
+
 class ConversationHandler(BaseHandler):
     """Handler for conversation-related HubSpot tools."""
     
@@ -27,14 +40,7 @@ class ConversationHandler(BaseHandler):
         Returns:
             Schema definition dictionary
         """
-        return {
-            "type": "object",
-            "properties": {
-                "limit": {"type": "integer", "description": "Maximum number of threads to return (default: 10)"},
-                "after": {"type": "string", "description": "Pagination token"},
-                "refresh_cache": {"type": "boolean", "description": "Whether to refresh the threads cache (default: false)"}
-            },
-        }
+        return RECENT_CONVERSATIONS_SCHEMA
     
     def get_recent_conversations(self, arguments: Optional[Dict[str, Any]]) -> List[types.TextContent]:
         """Get recent conversation threads from HubSpot with their messages.
@@ -46,13 +52,10 @@ class ConversationHandler(BaseHandler):
             Text response with conversation data
         """
         # Extract parameters with defaults if not provided
-        limit = self.get_argument_with_default(arguments, "limit", 10)
+        limit = self.get_int_argument(arguments, "limit", 10)
         after = self.get_argument_with_default(arguments, "after", None)
         refresh_cache = self.get_argument_with_default(arguments, "refresh_cache", False)
         
-        # Ensure limit is an integer
-        limit = int(limit) if limit is not None else 10
-        
         # Get recent conversations with pagination
         self.logger.debug(f"Getting recent conversations with limit={limit}, after={after}, refresh_cache={refresh_cache}")
         results = self.hubspot.get_recent_conversations(limit=limit, after=after, refresh_cache=refresh_cache)
@@ -80,42 +83,61 @@ class ConversationHandler(BaseHandler):
             after: Pagination token used in the request
         """
         try:
-            data = results.get("results", [])
+            data = results.get("results") or ()
             if data:
-                # Store each thread individually in FAISS
-                self.logger.debug(f"Preparing to store {len(data)} conversation threads in FAISS individually")
-                for i, thread in enumerate(data):
-                    thread_metadata = {
-                        "thread_id": thread.get("id", f"unknown_{i}"),
-                        "limit": limit,
-                        "after": after
-                    }
-                    self.logger.debug(f"Storing thread {i+1}/{len(data)} with ID {thread_metadata['thread_id']}")
-                    
-                    # Store single thread as a list with one item to maintain format compatibility
-                    self.store_in_faiss_safely(
-                        data=[thread],  # Store as single-item list
-                        data_type="conversation_thread",
-                        metadata_extras=thread_metadata
-                    )
+                # Store every thread in one batch, each with its own thread ID
+                self.logger.debug(f"Preparing to store {len(data)} conversation threads in FAISS")
+                thread_metadata = [
+                    {"thread_id": thread.get("id", f"unknown_{i}")}
+                    for i, thread in enumerate(data)
+                ]
+                
+                self.store_in_faiss_safely(
+                    data=data,
+                    data_type="conversation_thread",
+                    metadata_extras={"limit": limit, "after": after},
+                    item_metadata_extras=thread_metadata
+                )
         except Exception as e:
             self.logger.error(f"Error storing conversations in FAISS: {str(e)}", exc_info=True)
     
     def _truncate_conversation_messages(self, results: Dict[str, Any]) -> Dict[str, Any]:
         """Truncate message text for API response.
         
+        Threads and messages are copied rather than modified, because the same
+        objects are held as metadata by the FAISS index.
+        
         Args:
             results: Conversation results
             
         Returns:
             Results with truncated message text
         """
-        truncated_results = results.copy()
-        for thread in truncated_results.get("results", []):
-            for message in thread.get("messages", []):
-                if "text" in message:
-                    message["text"] = message["text"][:200] if message["text"] else ""
-                if "rich_text" in message:
-                    message["rich_text"] = message["rich_text"][:200] if message["rich_text"] else ""
+        threads = results.get("results")
+        if not threads:
+            return results
+        
+        truncated_threads = []
+        for thread in threads:
+            messages = thread.get("messages")
+            if messages:
+                thread = {**thread, "messages": [self._truncate_message(message) for message in messages]}
+            truncated_threads.append(thread)
         
-        return truncated_results
+        return {**results, "results": truncated_threads}
+    
+    def _truncate_message(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy a message with its text fields truncated.
+        
+        Args:
+            message: Formatted message
+            
+        Returns:
+            Message with at most MESSAGE_PREVIEW_LENGTH characters of text and rich text
+        """
+        truncated_message = dict(message)
+        if "text" in message:
+            truncated_message["text"] = (message["text"] or "")[:MESSAGE_PREVIEW_LENGTH]
+        if "rich_text" in message:
+            truncated_message["rich_text"] = (message["rich_text"] or "")[:MESSAGE_PREVIEW_LENGTH]
+        return truncated_message
@@ -11,6 +11,16 @@ from ..faiss_manager import FaissManager
 from ..utils import search_in_faiss
 from .base_handler import BaseHandler
 
+# Input schema for searching stored data
+SEARCH_DATA_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "query": {"type": "string", "description": "Text query to search for"},
+        "limit": {"type": "integer", "description": "Maximum number of results to return (default: 10)"}
+    },
+    "required": ["query"]
+}
+
 class SearchHandler(BaseHandler):
     """Handler for search operations on indexed HubSpot data."""
     
@@ -34,14 +44,7 @@ class SearchHandler(BaseHandler):
         Returns:
             Schema definition dictionary
         """
-        return {
-            "type": "object",
-            "properties": {
-                "query": {"type": "string", "description": "Text query to search for"},
-                "limit": {"type": "integer", "description": "Maximum number of results to return (default: 10)"}
-            },
-            "required": ["query"]
-        }
+        return SEARCH_DATA_SCHEMA
     
     def search_data(self, arguments: Optional[Dict[str, Any]]) -> List[types.TextContent]:
         """Search for similar data in stored HubSpot API responses.
@@ -53,11 +56,10 @@ class SearchHandler(BaseHandler):
             Text response with search results
         """
         # Validate required parameters
-        self.validate_required_arguments(arguments, ["query"])
+        self.validate_required_arguments(arguments, ("query",))
         
         query = arguments["query"]
-        limit = self.get_argument_with_default(arguments, "limit", 10)
-        limit = int(limit) if limit is not None else 10
+        limit = self.get_int_argument(arguments, "limit", 10)
         
         try:
             results, _ = search_in_faiss(
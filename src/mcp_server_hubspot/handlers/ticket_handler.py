@@ -8,6 +8,30 @@ import mcp.types as types
 
 from .base_handler import BaseHandler
 
+# Input schema for tickets
+TICKETS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "criteria": {
+            "type": "string", 
+            "enum": ["default", "Closed"],
+            "description": "Selection criteria for tickets: 'default' (tickets with close date or last modified date > 1 day ago) or 'closed' (tickets with status equals 'Closed')"
+        },
+        "limit": {"type": "integer", "description": "Maximum number of tickets to return (default: 50)"},
+        "max_retries": {"type": "integer", "description": "Maximum number of retry attempts for rate limiting (default: 3)"},
+        "retry_delay": {"type": "number", "description": "Initial delay between retries in seconds (default: 1.0)"}
+    },
+}
+
+# Input schema for ticket conversation threads
+TICKET_CONVERSATION_THREADS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "ticket_id": {"type": "string", "description": "ID of the ticket to retrieve conversation threads for"}
+    },
+    "required": ["ticket_id"]
+}
+
 class TicketHandler(BaseHandler):
     """Handler for ticket-related HubSpot tools."""
     
@@ -27,19 +51,7 @@ class TicketHandler(BaseHandler):
         Returns:
             Schema definition dictionary
         """
-        return {
-            "type": "object",
-            "properties": {
-                "criteria": {
-                    "type": "string", 
-                    "enum": ["default", "Closed"],
-                    "description": "Selection criteria for tickets: 'default' (tickets with close date or last modified date > 1 day ago) or 'closed' (tickets with status equals 'Closed')"
-                },
-                "limit": {"type": "integer", "description": "Maximum number of tickets to return (default: 50)"},
-                "max_retries": {"type": "integer", "description": "Maximum number of retry attempts for rate limiting (default: 3)"},
-                "retry_delay": {"type": "number", "description": "Initial delay between retries in seconds (default: 1.0)"}
-            },
-        }
+        return TICKETS_SCHEMA
     
     def get_ticket_conversation_threads_schema(self) -> Dict[str, Any]:
         """Get the input schema for ticket conversation threads.
@@ -47,13 +59,7 @@ class TicketHandler(BaseHandler):
         Returns:
             Schema definition dictionary
         """
-        return {
-            "type": "object",
-            "properties": {
-                "ticket_id": {"type": "string", "description": "ID of the ticket to retrieve conversation threads for"}
-            },
-            "required": ["ticket_id"]
-        }
+        return TICKET_CONVERSATION_THREADS_SCHEMA
     
     def get_tickets(self, arguments: Optional[Dict[str, Any]]) -> List[types.TextContent]:
         """Get tickets from HubSpot based on configurable selection criteria.
@@ -66,14 +72,9 @@ class TicketHandler(BaseHandler):
         """
         # Extract parameters with defaults
         criteria = self.get_argument_with_default(arguments, "criteria", "default")
-        limit = self.get_argument_with_default(arguments, "limit", 50)
-        max_retries = self.get_argument_with_default(arguments, "max_retries", 3)
-        retry_delay = self.get_argument_with_default(arguments, "retry_delay", 1.0)
-        
-        # Ensure parameters are of correct type
-        limit = int(limit) if limit is not None else 50
-        max_retries = int(max_retries) if max_retries is not None else 3
-        retry_delay = float(retry_delay) if retry_delay is not None else 1.0
+        limit = self.get_int_argument(arguments, "limit", 50)
+        max_retries = self.get_int_argument(arguments, "max_retries", 3)
+        retry_delay = self.get_float_argument(arguments, "retry_delay", 1.0)
         
         # Validate criteria
         if criteria not in ["default", "Closed"]:
@@ -113,7 +114,7 @@ class TicketHandler(BaseHandler):
             limit: Limit parameter used in the request
         """
         try:
-            data = results.get("results", [])
+            data = results.get("results") or ()
             if data:
                 metadata_extras = {
                     "criteria": criteria,
@@ -140,7 +141,7 @@ class TicketHandler(BaseHandler):
             Text response with conversation thread data
         """
         # Validate required parameters
-        self.validate_required_arguments(arguments, ["ticket_id"])
+        self.validate_required_arguments(arguments, ("ticket_id",))
         
         ticket_id = arguments["ticket_id"]
         
@@ -187,7 +188,7 @@ class TicketHandler(BaseHandler):
             ticket_id: Ticket ID used in the request
         """
         try:
-            threads_data = results.get("threads", [])
+            threads_data = results.get("threads") or ()
             if threads_data:
                 metadata_extras = {
                     "ticket_id": ticket_id,
@@ -13,6 +13,7 @@ from hubspot.crm.contacts.exceptions import ApiException
 
 from .core.storage import ThreadStorage
 from .core.formatters import convert_datetime_fields
+from .core.http import create_session, get_hubspot_client
 from .clients.company_client import CompanyClient
 from .clients.contact_client import ContactClient
 from .clients.conversation_client import ConversationClient
@@ -33,17 +34,20 @@ class HubSpotClient:
             access_token: HubSpot API access token. If None, uses HUBSPOT_ACCESS_TOKEN env var
         """
         self.access_token = self._get_access_token(access_token)
-        self.client = HubSpot(access_token=self.access_token)
+        self.client = get_hubspot_client(self.access_token)
+        self.session = create_session()
         
         # Initialize storage
         storage_dir = pathlib.Path("storage")
         self.thread_storage = ThreadStorage(storage_dir)
         
         # Initialize domain-specific clients
-        self.companies = CompanyClient(self.client, self.access_token)
-        self.contacts = ContactClient(self.client, self.access_token)
-        self.conversations = ConversationClient(self.client, self.access_token, self.thread_storage)
-        self.tickets = TicketClient(self.client, self.access_token)
+        self.companies = CompanyClient(self.client, self.access_token, self.session)
+        self.contacts = ContactClient(self.client, self.access_token, self.session)
+        self.conversations = ConversationClient(
+            self.client, self.access_token, self.thread_storage, self.session
+        )
+        self.tickets = TicketClient(self.client, self.access_token, self.session)
     
     def _get_access_token(self, access_token: Optional[str]) -> str:
         """Retrieve and validate the HubSpot access token.
@@ -74,6 +78,17 @@ class HubSpotClient:
             JSON string with company data
         """
         return self.companies.get_recent(limit)
+    
+    def get_recent_companies_data(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Get most recently active companies from HubSpot as parsed data.
+        
+        Args:
+            limit: Maximum number of companies to return (default: 10)
+            
+        Returns:
+            List of company dictionaries
+        """
+        return self.companies.get_recent_data(limit)
         
     def get_company_activity(self, company_id: str) -> str:
         """Get activity history for a specific company.
@@ -86,6 +101,17 @@ class HubSpotClient:
         """
         return self.companies.get_activity(company_id)
     
+    def get_company_activity_data(self, company_id: str) -> List[Dict[str, Any]]:
+        """Get activity history for a specific company as parsed data.
+        
+        Args:
+            company_id: HubSpot company ID
+            
+        Returns:
+            List of engagement dictionaries
+        """
+        return self.companies.get_activity_data(company_id)
+    
     def get_recent_contacts(self, limit: int = 10) -> str:
         """Get most recently active contacts from HubSpot.
         
@@ -97,6 +123,29 @@ class HubSpotClient:
         """
         return self.contacts.get_recent(limit)
     
+    def get_recent_contacts_data(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Get most recently active contacts from HubSpot as parsed data.
+        
+        Args:
+            limit: Maximum number of contacts to return (default: 10)
+            
+        Returns:
+            List of contact dictionaries
+        """
+        return self.contacts.get_recent_data(limit)
+    
+    def create_contacts(self, contacts: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Create multiple contacts in HubSpot, skipping existing ones.
+        
+        Args:
+            contacts: List of contact properties (first name, last name, email, etc.)
+            
+        Returns:
+            Dictionary with the created contacts, the matching existing contacts and
+            the errors of contacts that could not be created
+        """
+        return self.contacts.create_contacts(contacts)
+    
     def get_recent_emails(self, limit: int = 10, after: Optional[str] = None) -> Dict[str, Any]:
         """Get recent emails from HubSpot with pagination.
         
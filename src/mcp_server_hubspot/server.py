@@ -56,23 +56,27 @@ async def main(access_token: Optional[str] = None):
         search_handler
     )
     
-    # Based on MCP implementation, use stdio_server as a context manager that yields streams
-    async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
-        # Log server start
-        logger.info("Server running with stdio transport")
-        
-        # Create initialization options with capabilities
-        initialization_options = InitializationOptions(
-            server_name="hubspot-manager",
-            server_version="0.2.0",
-            capabilities=server.get_capabilities(
-                notification_options=NotificationOptions(),
-                experimental_capabilities={}
+    try:
+        # Based on MCP implementation, use stdio_server as a context manager that yields streams
+        async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
+            # Log server start
+            logger.info("Server running with stdio transport")
+            
+            # Create initialization options with capabilities
+            initialization_options = InitializationOptions(
+                server_name="hubspot-manager",
+                server_version="0.2.0",
+                capabilities=server.get_capabilities(
+                    notification_options=NotificationOptions(),
+                    experimental_capabilities={}
+                )
             )
-        )
-        
-        # Run the server with the provided streams and options
-        await server.run(read_stream, write_stream, initialization_options)
+            
+            # Run the server with the provided streams and options
+            await server.run(read_stream, write_stream, initialization_options)
+    finally:
+        # Save vectors still below the flush thresholds when the server stops
+        faiss_manager.flush()
 
 def initialize_embedding_model() -> SentenceTransformer:
     """Initialize and return the embedding model."""
@@ -202,6 +206,11 @@ def register_tool_definitions(
                 description="Create a new contact in HubSpot",
                 inputSchema=contact_handler.get_create_contact_schema(),
             ),
+            types.Tool(
+                name="hubspot_create_contacts",
+                description="Create several contacts in HubSpot in batches, skipping existing ones",
+                inputSchema=contact_handler.get_create_contacts_schema(),
+            ),
             types.Tool(
                 name="hubspot_get_active_contacts",
                 description="Get most recently active contacts from HubSpot",
@@ -253,6 +262,19 @@ def register_tool_call_handler(
         ticket_handler: Handler for ticket operations
         search_handler: Handler for search operations
     """
+    tool_handlers = {
+        "hubspot_create_company": company_handler.create_company,
+        "hubspot_get_company_activity": company_handler.get_company_activity,
+        "hubspot_get_active_companies": company_handler.get_active_companies,
+        "hubspot_create_contact": contact_handler.create_contact,
+        "hubspot_create_contacts": contact_handler.create_contacts,
+        "hubspot_get_active_contacts": contact_handler.get_active_contacts,
+        "hubspot_get_recent_conversations": conversation_handler.get_recent_conversations,
+        "hubspot_get_tickets": ticket_handler.get_tickets,
+        "hubspot_get_ticket_conversation_threads": ticket_handler.get_ticket_conversation_threads,
+        "hubspot_search_data": search_handler.search_data,
+    }
+    
     @server.call_tool()
     async def handle_call_tool(
         name: str, arguments: dict[str, Any] | None
@@ -260,26 +282,13 @@ def register_tool_call_handler(
         """Handle tool execution requests"""
         try:
             # Route to appropriate handler based on tool name
-            if name == "hubspot_create_company":
-                return company_handler.create_company(arguments)
-            elif name == "hubspot_get_company_activity":
-                return company_handler.get_company_activity(arguments)
-            elif name == "hubspot_get_active_companies":
-                return company_handler.get_active_companies(arguments)
-            elif name == "hubspot_create_contact":
-                return contact_handler.create_contact(arguments)
-            elif name == "hubspot_get_active_contacts":
-                return contact_handler.get_active_contacts(arguments)
-            elif name == "hubspot_get_recent_conversations":
-                return conversation_handler.get_recent_conversations(arguments)
-            elif name == "hubspot_get_tickets":
-                return ticket_handler.get_tickets(arguments)
-            elif name == "hubspot_get_ticket_conversation_threads":
-                return ticket_handler.get_ticket_conversation_threads(arguments)
-            elif name == "hubspot_search_data":
-                return search_handler.search_data(arguments)
-            else:
+            handler = tool_handlers.get(name)
+            if handler is None:
                 raise ValueError(f"Unknown tool: {name}")
+            
+            # Handlers make blocking HubSpot and FAISS calls, so run them in a
+            # worker thread to keep the event loop free for other requests
+            return await asyncio.to_thread(handler, arguments)
         except ApiException as e:
             return [types.TextContent(type="text", text=f"HubSpot API error: {str(e)}")]
         except Exception as e:
@@ -1,14 +1,17 @@
 """Utility functions for HubSpot MCP server."""
 
-import json
 import logging
 import numpy as np
 from typing import Dict, List, Any, Optional, Tuple
 from sentence_transformers import SentenceTransformer
+from .core.serialization import dumps
 from .faiss_manager import FaissManager
 
 logger = logging.getLogger("mcp_hubspot_utils")
 
+# Number of texts the embedding model encodes per forward pass
+EMBEDDING_BATCH_SIZE = 64
+
 def generate_embeddings(data: List[Dict[str, Any]], model: SentenceTransformer) -> np.ndarray:
     """Generate embeddings for a list of data items.
     
@@ -19,24 +22,29 @@ def generate_embeddings(data: List[Dict[str, Any]], model: SentenceTransformer)
     Returns:
         NumPy array of embeddings
     """
-    texts = [json.dumps(item) for item in data]
-    return np.array(model.encode(texts))
+    # CRM projections carry datetime fields, which only the shared encoder handles
+    texts = [dumps(item) for item in data]
+    return model.encode(texts, batch_size=EMBEDDING_BATCH_SIZE, convert_to_numpy=True)
 
 def store_in_faiss(
     faiss_manager: FaissManager, 
     data: List[Dict[str, Any]], 
     data_type: str,
     model: SentenceTransformer,
-    metadata_extras: Optional[Dict[str, Any]] = None
+    metadata_extras: Optional[Dict[str, Any]] = None,
+    item_metadata_extras: Optional[List[Dict[str, Any]]] = None
 ) -> None:
     """Store data in FAISS index.
     
+    All items are embedded in one batched call and added to the index at once.
+    
     Args:
         faiss_manager: FAISS manager instance
         data: List of data items to store
         data_type: Type of data (company, contact, engagement, etc.)
         model: SentenceTransformer model to use
         metadata_extras: Additional metadata to store with each item
+        item_metadata_extras: Additional metadata for each item, in the same order as data
     """
     try:
         logger.debug(f"Starting store_in_faiss for {data_type} with {len(data) if data else 0} items")
@@ -54,13 +62,15 @@ def store_in_faiss(
         # Create metadata list
         logger.debug(f"Creating metadata for {len(data)} {data_type} items")
         metadata_list = []
-        for item in data:
+        for i, item in enumerate(data):
             metadata = {
                 "type": data_type,
                 "data": item
             }
             if metadata_extras:
                 metadata.update(metadata_extras)
+            if item_metadata_extras:
+                metadata.update(item_metadata_extras[i])
             metadata_list.append(metadata)
         
         # Store in FAISS
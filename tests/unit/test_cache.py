@@ -0,0 +1,87 @@
+"""
+Unit tests for the TTL cache and the ttl_cached decorator.
+"""
+import pytest
+
+from mcp_server_hubspot.core import cache as cache_module
+from mcp_server_hubspot.core.cache import TTLCache, ttl_cached
+
+@pytest.fixture(autouse=True)
+def fake_time(monkeypatch, clock):
+    monkeypatch.setattr(cache_module, "time", clock)
+
+class FakeClient:
+    """Client whose cached lookup counts the calls that reach the API."""
+
+    def __init__(self, access_token: str, shared_cache: TTLCache):
+        self.access_token = access_token
+        self._lookup_cache = shared_cache
+        self.calls = 0
+
+    @ttl_cached("_lookup_cache")
+    def lookup(self, key: str, limit: int = 10):
+        self.calls += 1
+        if key == "fail":
+            raise RuntimeError("API error")
+        return f"{self.access_token}:{key}:{limit}"
+
+def test_entries_expire_after_ttl(clock):
+    cache = TTLCache(ttl=10)
+    cache.set("key", "value")
+
+    clock.advance(9.9)
+    assert cache.get("key") == "value"
+    clock.advance(0.1)
+    assert cache.get("key") is None
+    assert cache.get("key", "default") == "default"
+
+def test_full_cache_evicts_expired_entries_first(clock):
+    cache = TTLCache(ttl=10, maxsize=2)
+    cache.set("old", 1)
+    clock.advance(5)
+    cache.set("new", 2)
+    clock.advance(6)
+
+    # "old" has expired, so it is dropped and "new" survives
+    cache.set("third", 3)
+    assert cache.get("old") is None
+    assert cache.get("new") == 2
+    assert cache.get("third") == 3
+
+def test_full_cache_evicts_oldest_entry(clock):
+    cache = TTLCache(ttl=10, maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert cache.get("c") == 3
+
+def test_ttl_cached_reuses_results_until_expiry(clock):
+    client = FakeClient("token-a", TTLCache(ttl=30))
+
+    assert client.lookup("x") == client.lookup("x") == "token-a:x:10"
+    assert client.lookup("x", limit=5) == "token-a:x:5"
+    assert client.calls == 2
+
+    clock.advance(30)
+    client.lookup("x")
+    assert client.calls == 3
+
+def test_ttl_cached_does_not_cache_exceptions():
+    client = FakeClient("token-a", TTLCache(ttl=30))
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            client.lookup("fail")
+    assert client.calls == 2
+
+def test_ttl_cached_keys_are_split_per_access_token():
+    shared_cache = TTLCache(ttl=30)
+    client_a = FakeClient("token-a", shared_cache)
+    client_b = FakeClient("token-b", shared_cache)
+
+    assert client_a.lookup("x") == "token-a:x:10"
+    assert client_b.lookup("x") == "token-b:x:10"
+    assert (client_a.calls, client_b.calls) == (1, 1)
@@ -0,0 +1,129 @@
+"""
+Unit tests for the company client's engagement reads.
+"""
+import copy
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from mcp_server_hubspot.clients.company_client import CompanyClient
+from mcp_server_hubspot.core.formatters import parse_timestamp_ms
+from mcp_server_hubspot.core.serialization import dumps
+
+# Email engagement as returned by the legacy v1 endpoint
+V1_EMAIL = {
+    "engagement": {
+        "id": 42,
+        "type": "EMAIL",
+        "createdAt": 1700000000123,
+        "lastUpdated": 1700000100456,
+        "createdBy": 7,
+        "modifiedBy": 8,
+        "timestamp": 1700000000000
+    },
+    "associations": {
+        "contactIds": [11],
+        "companyIds": [22],
+        "dealIds": [],
+        "ticketIds": [],
+        "ownerIds": [9]
+    },
+    "metadata": {
+        "from": {"email": "ann@example.com", "firstName": "Ann", "lastName": "Lee", "raw": "Ann Lee <ann@example.com>"},
+        "sender": {"email": "ann@example.com"},
+        "to": [{"email": "bob@example.org", "firstName": "Bob", "lastName": "Ray", "raw": "bob@example.org"}],
+        "cc": [],
+        "bcc": [],
+        "subject": "Renewal",
+        "text": "Hello Bob",
+        "html": "<p>Hello Bob</p>"
+    }
+}
+
+# The same engagement as returned by the CRM v3 batch read endpoint
+V3_EMAIL = {
+    "id": "42",
+    "createdAt": "2023-11-14T22:13:20.123Z",
+    "updatedAt": "2023-11-14T22:15:00.456Z",
+    "properties": {
+        "hs_engagement_type": "EMAIL",
+        "hs_timestamp": "2023-11-14T22:13:20Z",
+        "hs_created_by": "7",
+        "hs_modified_by": "8",
+        "hubspot_owner_id": "9",
+        "hs_email_subject": "Renewal",
+        "hs_email_text": "Hello Bob",
+        "hs_email_html": "<p>Hello Bob</p>",
+        "hs_email_headers": dumps({
+            key: V1_EMAIL["metadata"][key] for key in ("from", "sender", "to", "cc", "bcc")
+        })
+    }
+}
+
+# Associations v4 batch read results of the engagement, per associated object type
+V4_ASSOCIATIONS = {
+    "contacts": [{"from": {"id": "42"}, "to": [{"toObjectId": 11, "associationTypes": []}]}],
+    "companies": [{"from": {"id": "42"}, "to": [{"toObjectId": 22, "associationTypes": []}]}],
+    "deals": [],
+    "tickets": []
+}
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response."""
+
+    def __init__(self, payload, status_code=200):
+        self.payload = payload
+        self.status_code = status_code
+
+    def json(self):
+        return self.payload
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error")
+
+def make_client(batch_available: bool, v3_engagement: dict = V3_EMAIL) -> CompanyClient:
+    """Build a company client whose raw API requests are answered from the fixtures."""
+    client = CompanyClient(MagicMock(), "test-token")
+
+    def api_request(options):
+        path = options["path"]
+        if path == "/engagements/v1/engagements/42":
+            return FakeResponse(V1_EMAIL)
+        if not batch_available:
+            return FakeResponse({}, status_code=500)
+        if path == "/crm/v3/objects/engagements/batch/read":
+            return FakeResponse({"results": [v3_engagement]})
+        object_type = path.split("/")[-3]
+        return FakeResponse({"results": V4_ASSOCIATIONS[object_type]})
+
+    client._api_request = api_request
+    return client
+
+def test_batch_and_v1_engagements_match():
+    batch_engagements = make_client(batch_available=True)._get_engagement_details(["42"])
+    v1_engagements = make_client(batch_available=False)._get_engagement_details(["42"])
+
+    assert batch_engagements == v1_engagements
+    engagement = batch_engagements[0]
+    assert engagement["created_at"] == 1700000000123
+    assert engagement["associations"]["contactIds"] == [11]
+    assert engagement["content"]["from"]["email"] == "ann@example.com"
+    assert engagement["content"]["to"][0]["email"] == "bob@example.org"
+
+def test_unconvertible_batch_engagement_falls_back_to_v1():
+    broken_email = copy.deepcopy(V3_EMAIL)
+    broken_email["properties"]["hs_timestamp"] = "not a timestamp"
+    engagements = make_client(batch_available=True, v3_engagement=broken_email)._get_engagement_details(["42"])
+
+    assert engagements == make_client(batch_available=False)._get_engagement_details(["42"])
+
+@pytest.mark.parametrize("value, expected", [
+    ("2023-11-14T22:13:20Z", 1700000000000),
+    ("2023-11-14T22:13:20.123Z", 1700000000123),
+    ("2023-11-14T23:13:20.123+01:00", 1700000000123),
+    ("1700000000123", 1700000000123)
+])
+def test_parse_timestamp_ms(value, expected):
+    assert parse_timestamp_ms(value) == expected
@@ -0,0 +1,68 @@
+"""
+Unit tests for the contact client's create paths.
+"""
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import requests
+
+from mcp_server_hubspot.clients import contact_client
+from mcp_server_hubspot.clients.contact_client import CONTACT_BATCH_SIZE, ContactClient
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response."""
+
+    def __init__(self, payload, status_code=200):
+        self.payload = payload
+        self.status_code = status_code
+
+    def json(self):
+        return self.payload
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error")
+
+def make_client() -> ContactClient:
+    """Build a contact client that never finds existing contacts in batch lookups."""
+    client = ContactClient(MagicMock(), "test-token")
+    client._find_existing_contacts = lambda contacts: {}
+    return client
+
+def test_create_contacts_returns_partial_success(monkeypatch):
+    contacts = [{"firstname": f"First{i}", "lastname": "Last"} for i in range(CONTACT_BATCH_SIZE + 1)]
+
+    def send_api_request(session, hubspot_client, options):
+        inputs = options["body"]["inputs"]
+        if len(inputs) == 1:
+            return FakeResponse({"message": "Internal error"}, status_code=500)
+        return FakeResponse({
+            "status": "COMPLETE",
+            "results": [{"id": str(i), "properties": item["properties"]} for i, item in enumerate(inputs[1:])],
+            "errors": [{"status": "error", "category": "VALIDATION_ERROR", "message": "Invalid email"}]
+        }, status_code=207)
+
+    monkeypatch.setattr(contact_client, "send_api_request", send_api_request)
+    client = make_client()
+    client._existing_contact_cache.set("stale", {"id": "1"})
+
+    result = client.create_contacts(contacts)
+
+    assert len(result["results"]) == CONTACT_BATCH_SIZE - 1
+    assert result["already_exists"] == []
+    assert [error.get("category") for error in result["errors"]] == ["VALIDATION_ERROR", None]
+    assert result["errors"][1]["inputs"] == contacts[CONTACT_BATCH_SIZE:]
+    assert client._existing_contact_cache.get("stale") is None
+
+def test_find_existing_contact_does_not_cache_misses():
+    client = ContactClient(MagicMock(), "test-token")
+    found = SimpleNamespace(to_dict=lambda: {"id": "7"})
+    client.client.crm.contacts.search_api.do_search.side_effect = [
+        SimpleNamespace(total=0, results=[]),
+        SimpleNamespace(total=1, results=[found])
+    ]
+
+    assert client._find_existing_contact("Ann", "Lee") is None
+    assert client._find_existing_contact("Ann", "Lee") == {"id": "7"}
+    assert client._find_existing_contact("Ann", "Lee") == {"id": "7"}
+    assert client.client.crm.contacts.search_api.do_search.call_count == 2
@@ -0,0 +1,84 @@
+"""
+Unit tests for the contact tool handlers.
+"""
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from mcp_server_hubspot.clients import contact_client
+from mcp_server_hubspot.clients.contact_client import EXISTING_CONTACT_PROPERTIES, ContactClient
+from mcp_server_hubspot.handlers.contact_handler import ContactHandler
+
+EXISTING_PREFIX = "Contact already exists: "
+
+def make_handler() -> ContactHandler:
+    """Build a contact handler backed by a contact client with a mocked SDK."""
+    contacts = ContactClient(MagicMock(), "test-token")
+    hubspot = SimpleNamespace(contacts=contacts, create_contacts=contacts.create_contacts)
+    return ContactHandler(hubspot, MagicMock(), MagicMock())
+
+def test_create_contact_tool_uses_narrowed_cached_lookup():
+    handler = make_handler()
+    sdk = handler.hubspot.contacts.client
+    found = SimpleNamespace(to_dict=lambda: {"id": "7"})
+    sdk.crm.contacts.search_api.do_search.return_value = SimpleNamespace(total=1, results=[found])
+    arguments = {"firstname": "Ann", "lastname": "Lee", "properties": {"company": "Acme"}}
+
+    for _ in range(2):
+        text = handler.create_contact(arguments)[0].text
+        assert text.startswith(EXISTING_PREFIX)
+        assert json.loads(text[len(EXISTING_PREFIX):]) == {"id": "7"}
+
+    assert sdk.crm.contacts.search_api.do_search.call_count == 1
+    search_request = sdk.crm.contacts.search_api.do_search.call_args.kwargs["public_object_search_request"]
+    assert search_request.limit == 1
+    assert tuple(search_request.properties) == EXISTING_CONTACT_PROPERTIES
+    assert len(search_request.filter_groups[0]["filters"]) == 3
+    sdk.crm.contacts.basic_api.create.assert_not_called()
+
+def test_create_contact_tool_creates_new_contact():
+    handler = make_handler()
+    sdk = handler.hubspot.contacts.client
+    sdk.crm.contacts.search_api.do_search.return_value = SimpleNamespace(total=0, results=[])
+    sdk.crm.contacts.basic_api.create.return_value = SimpleNamespace(to_dict=lambda: {"id": "8"})
+
+    text = handler.create_contact({"firstname": "Ann", "lastname": "Lee", "email": "ann@example.com"})[0].text
+
+    assert json.loads(text) == {"id": "8"}
+    create_input = sdk.crm.contacts.basic_api.create.call_args.kwargs["simple_public_object_input_for_create"]
+    assert create_input.properties == {"firstname": "Ann", "lastname": "Lee", "email": "ann@example.com"}
+
+def test_create_contacts_tool_creates_batch(monkeypatch):
+    handler = make_handler()
+    handler.hubspot.contacts._find_existing_contacts = lambda contacts: {}
+    requests_sent = []
+
+    def send_api_request(session, hubspot_client, options):
+        requests_sent.append(options)
+        inputs = options["body"]["inputs"]
+        return SimpleNamespace(
+            raise_for_status=lambda: None,
+            json=lambda: {"results": [{"id": str(i), "properties": item["properties"]} for i, item in enumerate(inputs)]}
+        )
+
+    monkeypatch.setattr(contact_client, "send_api_request", send_api_request)
+    arguments = {"contacts": [
+        {"firstname": "Ann", "lastname": "Lee", "properties": {"company": "Acme"}},
+        {"firstname": "Bob", "lastname": "Ray", "email": "bob@example.org"}
+    ]}
+
+    result = json.loads(handler.create_contacts(arguments)[0].text)
+
+    assert len(requests_sent) == 1
+    assert [item["properties"] for item in requests_sent[0]["body"]["inputs"]] == [
+        {"firstname": "Ann", "lastname": "Lee", "company": "Acme"},
+        {"firstname": "Bob", "lastname": "Ray", "email": "bob@example.org"}
+    ]
+    assert [contact["id"] for contact in result["results"]] == ["0", "1"]
+    assert result["already_exists"] == [] and result["errors"] == []
+
+def test_create_contacts_tool_requires_names():
+    with pytest.raises(ValueError, match="lastname"):
+        make_handler().create_contacts({"contacts": [{"firstname": "Ann"}]})
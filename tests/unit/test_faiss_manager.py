@@ -0,0 +1,137 @@
+"""
+Unit tests for the FAISS index manager's persistence.
+"""
+import json
+import os
+import time
+from datetime import date, datetime, timedelta
+
+import faiss
+import numpy as np
+import pytest
+
+from mcp_server_hubspot.faiss_manager import ID_DATE_SHIFT, FaissManager
+
+# Embedding dimension used by the tests
+DIMENSION = 8
+
+@pytest.fixture
+def vectors() -> np.ndarray:
+    return np.random.default_rng(0).random((5, DIMENSION), dtype=np.float32)
+
+def past_str(days: int = 1) -> str:
+    return (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
+
+def make_manager(storage_dir, **kwargs) -> FaissManager:
+    return FaissManager(storage_dir=str(storage_dir), embedding_dimension=DIMENSION, **kwargs)
+
+def top_metadata(manager: FaissManager, vector: np.ndarray) -> dict:
+    metadata_list, _ = manager.search(vector, k=1)
+    return metadata_list[0]
+
+@pytest.mark.parametrize("with_id_map", [False, True])
+def test_migrates_sequential_id_index(tmp_path, vectors, with_id_map):
+    date_str = past_str()
+    if with_id_map:
+        # Older ID-mapped indexes numbered their vectors from 0, with metadata keyed by ID
+        index = faiss.IndexIDMap2(faiss.IndexFlatL2(DIMENSION))
+        index.add_with_ids(vectors, np.arange(len(vectors), dtype=np.int64))
+        legacy_metadata = {str(i): {"i": i} for i in range(len(vectors))}
+    else:
+        # The oldest indexes had no ID map, with metadata stored as a list in row order
+        index = faiss.IndexFlatL2(DIMENSION)
+        index.add(vectors)
+        legacy_metadata = [{"i": i} for i in range(len(vectors))]
+    faiss.write_index(index, str(tmp_path / f"index_{date_str}.faiss"))
+    (tmp_path / f"metadata_{date_str}.json").write_text(json.dumps(legacy_metadata))
+
+    manager = make_manager(tmp_path)
+    assert top_metadata(manager, vectors[3]) == {"i": 3}
+
+    id_base = date.fromisoformat(date_str).toordinal() << ID_DATE_SHIFT
+    assert sorted(manager.metadata[date_str]) == list(range(id_base, id_base + len(vectors)))
+    assert not (tmp_path / f"metadata_{date_str}.json").exists()
+    assert (tmp_path / f"metadata_{date_str}.ndjson").exists()
+
+    # New vectors go to today's index, and both days survive a reload
+    manager.add_data(vectors[:1] + 10, [{"i": "new"}])
+    manager.flush()
+
+    reloaded = make_manager(tmp_path)
+    assert top_metadata(reloaded, vectors[4]) == {"i": 4}
+    assert top_metadata(reloaded, vectors[0] + 10) == {"i": "new"}
+    assert sorted(reloaded.metadata[date_str]) == sorted(manager.metadata[date_str])
+    assert isinstance(reloaded.indexes[date_str], faiss.IndexIDMap2)
+
+def test_debounced_changes_reload_after_flush(tmp_path, vectors):
+    manager = make_manager(tmp_path, flush_every_n=3, flush_interval_s=3600)
+
+    manager.add_data(vectors[:2], [{"i": 0}, {"i": 1}])
+    assert make_manager(tmp_path).search(vectors[0], k=1) == ([], [])
+
+    # The third unsaved vector reaches flush_every_n and saves the index
+    manager.add_data(vectors[2:3], [{"i": 2}])
+    assert top_metadata(make_manager(tmp_path), vectors[2]) == {"i": 2}
+
+    manager.add_data(vectors[3:4], [{"i": 3}])
+    manager.flush()
+    reloaded = make_manager(tmp_path)
+    assert top_metadata(reloaded, vectors[3]) == {"i": 3}
+    assert sum(index.ntotal for index in reloaded.indexes.values()) == 4
+
+def test_idle_changes_are_saved_after_flush_interval(tmp_path, vectors):
+    manager = make_manager(tmp_path, flush_every_n=1000, flush_interval_s=0.2)
+    manager.add_data(vectors[:2], [{"i": 0}, {"i": 1}])
+
+    # No further add_data call comes; the flush timer saves the changes on its own
+    deadline = time.monotonic() + 5
+    while manager._dirty and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+    assert not manager._dirty
+    assert top_metadata(make_manager(tmp_path), vectors[1]) == {"i": 1}
+
+def test_recovers_from_interrupted_save(tmp_path, vectors):
+    manager = make_manager(tmp_path)
+    manager.add_data(vectors, [{"i": i} for i in range(len(vectors))])
+    manager.flush()
+
+    # Simulate a crash mid-save: partial temp files and a truncated last metadata line
+    date_str = manager._get_today_date_str()
+    (tmp_path / f"index_{date_str}.faiss.tmp").write_bytes(b"partial index")
+    (tmp_path / f"metadata_{date_str}.ndjson.tmp").write_text('{"id": 1, "meta')
+    with open(tmp_path / f"metadata_{date_str}.ndjson", "a") as f:
+        f.write('{"id": 99, "metadata": {"i"')
+
+    reloaded = make_manager(tmp_path)
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+    assert top_metadata(reloaded, vectors[1]) == {"i": 1}
+    assert len(reloaded.metadata[date_str]) == len(vectors)
+
+def test_past_days_are_mapped_read_only(tmp_path, vectors):
+    manager = make_manager(tmp_path)
+    day_one, day_two = past_str(2), past_str(1)
+    manager._get_today_date_str = lambda: day_one
+    manager.add_data(vectors[:2], [{"i": 0}, {"i": 1}])
+
+    # Rolling over to a new day saves the previous day and maps it from disk
+    manager._get_today_date_str = lambda: day_two
+    manager.add_data(vectors[2:3], [{"i": 2}])
+    assert day_one in manager._read_only_dates
+    day_one_path = tmp_path / f"index_{day_one}.faiss"
+    day_one_bytes = day_one_path.read_bytes()
+
+    # Writes only go to the current day
+    manager.add_data(vectors[3:4], [{"i": 3}])
+    manager.flush()
+    assert day_one_path.read_bytes() == day_one_bytes
+    assert manager.indexes[day_one].ntotal == 2
+
+    # Even if a mapped index is modified in memory, it is never saved over its file
+    manager.indexes[day_one].add_with_ids(vectors[4:5], np.array([manager._next_ids[day_one]], dtype=np.int64))
+    manager._save_index(day_one)
+    assert day_one_path.read_bytes() == day_one_bytes
+
+    reloaded = make_manager(tmp_path)
+    assert top_metadata(reloaded, vectors[1]) == {"i": 1}
+    assert {day_one, day_two} <= reloaded._read_only_dates
@@ -0,0 +1,42 @@
+"""
+Unit tests for the pooled HTTP transport.
+"""
+from hubspot import HubSpot
+
+from mcp_server_hubspot.core.http import create_session, send_api_request
+
+class RecordingSession:
+    """Session stand-in that records the requests sent through it."""
+
+    def __init__(self):
+        self.requests = []
+
+    def request(self, method, url, **kwargs):
+        self.requests.append((method, url, kwargs))
+        return "response"
+
+def test_send_api_request_uses_the_session_and_client_credentials():
+    session = RecordingSession()
+    client = HubSpot(access_token="token-a")
+
+    response = send_api_request(session, client, {
+        "method": "POST",
+        "path": "/crm/v3/objects/contacts/batch/create",
+        "qs": {"archived": "false"},
+        "body": {"inputs": []}
+    })
+
+    assert response == "response"
+    method, url, kwargs = session.requests[0]
+    assert method == "POST"
+    assert url == "https://api.hubapi.com/crm/v3/objects/contacts/batch/create?archived=false"
+    assert kwargs["headers"]["Authorization"] == "Bearer token-a"
+    assert kwargs["data"] == '{"inputs": []}'
+
+def test_create_session_pools_and_retries_https():
+    session = create_session()
+    adapter = session.get_adapter("https://api.hubapi.com")
+
+    assert adapter.max_retries.total == 3
+    assert 429 in adapter.max_retries.status_forcelist
+    assert session.headers["Connection"] == "keep-alive"
@@ -0,0 +1,42 @@
+"""
+Unit tests for the token bucket rate limiter.
+"""
+import pytest
+
+from mcp_server_hubspot.core import rate_limiter
+from mcp_server_hubspot.core.rate_limiter import TokenBucket, get_rate_limiter
+
+@pytest.fixture(autouse=True)
+def fake_time(monkeypatch, clock):
+    monkeypatch.setattr(rate_limiter, "time", clock)
+
+def test_full_bucket_allows_a_burst(clock):
+    bucket = TokenBucket(rate=3, per=1.0)
+    for _ in range(3):
+        bucket.acquire()
+    assert clock.sleeps == []
+
+def test_empty_bucket_blocks_until_a_token_refills(clock):
+    bucket = TokenBucket(rate=2, per=1.0)
+    bucket.acquire()
+    bucket.acquire()
+
+    with bucket:
+        pass
+    assert clock.sleeps == [pytest.approx(0.5)]
+
+def test_refill_is_capped_at_capacity(clock):
+    bucket = TokenBucket(rate=2, per=1.0)
+    bucket.acquire()
+    bucket.acquire()
+    clock.advance(60)
+
+    bucket.acquire()
+    bucket.acquire()
+    assert clock.sleeps == []
+    bucket.acquire()
+    assert clock.sleeps == [pytest.approx(0.5)]
+
+def test_buckets_are_shared_per_access_token():
+    assert get_rate_limiter("token-a") is get_rate_limiter("token-a")
+    assert get_rate_limiter("token-a") is not get_rate_limiter("token-b")
@@ -0,0 +1,37 @@
+"""
+Unit tests for the JSON serialization helpers.
+"""
+import json
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from mcp_server_hubspot.core import serialization
+
+pytest.importorskip("orjson")
+
+# Values whose serialized form must not depend on whether orjson is installed
+SAMPLES = [
+    datetime(2024, 1, 2, 3, 4, 5),
+    datetime(2024, 1, 2, 3, 4, 5, 123456),
+    datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+    datetime(2024, 1, 2, 3, 4, 5, 120000, tzinfo=timezone.utc),
+    datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone(timedelta(hours=2))),
+    date(2024, 1, 2)
+]
+
+@pytest.mark.parametrize("value", SAMPLES)
+def test_stdlib_fallback_matches_orjson(monkeypatch, value):
+    document = {"value": value, "nested": [value]}
+    with_orjson = json.loads(serialization.dumps(document))
+
+    monkeypatch.setattr(serialization, "orjson", None)
+    without_orjson = json.loads(serialization.dumps(document))
+
+    assert without_orjson == with_orjson
+
+def test_utc_datetime_uses_z_suffix(monkeypatch):
+    monkeypatch.setattr(serialization, "orjson", None)
+    value = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+    assert serialization.dumps(value) == '"2024-01-02T03:04:05Z"'
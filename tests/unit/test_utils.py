@@ -0,0 +1,52 @@
+"""
+Unit tests for the FAISS storage helpers.
+"""
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import numpy as np
+
+from mcp_server_hubspot.clients.company_client import RECENT_SEARCH_PROPERTIES
+from mcp_server_hubspot.core.formatters import project_crm_object
+from mcp_server_hubspot.faiss_manager import FaissManager
+from mcp_server_hubspot.utils import store_in_faiss
+
+# Embedding dimension used by the fake model
+DIMENSION = 8
+
+class FakeModel:
+    """Embedding model that hashes each text to a deterministic vector."""
+
+    def __init__(self):
+        self.texts = []
+
+    def encode(self, texts, batch_size=32, convert_to_numpy=True):
+        self.texts.extend(texts)
+        rows = [np.random.default_rng(abs(hash(text)) % (2 ** 32)).random(DIMENSION) for text in texts]
+        return np.array(rows, dtype="float32")
+
+def make_company() -> SimpleNamespace:
+    """Build an object shaped like an SDK company search result."""
+    return SimpleNamespace(
+        id="101",
+        properties={"name": "Acme", "domain": "acme.example"},
+        created_at=datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        updated_at=datetime(2024, 2, 3, 4, 5, 6, tzinfo=timezone.utc),
+        archived=False
+    )
+
+def test_store_projected_company(tmp_path):
+    manager = FaissManager(storage_dir=str(tmp_path), embedding_dimension=DIMENSION)
+    model = FakeModel()
+    company = project_crm_object(make_company(), RECENT_SEARCH_PROPERTIES)
+
+    store_in_faiss(manager, [company], "company", model, metadata_extras={"limit": 10})
+
+    assert len(model.texts) == 1
+    assert "2024-01-02T03:04:05" in model.texts[0]
+    assert sum(index.ntotal for index in manager.indexes.values()) == 1
+
+    results, _ = manager.search(model.encode([model.texts[0]])[0], k=1)
+    assert results[0]["type"] == "company"
+    assert results[0]["data"]["id"] == "101"
+    assert results[0]["limit"] == 10